@@ -14,7 +14,8 @@ Features:
 import sqlite3
 import json
 import os
-from datetime import datetime, timedelta
+import hashlib
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from contextlib import contextmanager
 from pathlib import Path
@@ -57,8 +58,11 @@ class DatabaseManager:
     @contextmanager
     def _get_connection(self):
         """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
+        # Scrapers write from several threads; wait on the lock instead of failing
+        conn = sqlite3.connect(self.db_path, timeout=30)
         conn.row_factory = sqlite3.Row
+        # Safe with WAL (set in _init_database) and avoids an fsync per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
             conn.commit()
@@ -73,6 +77,9 @@ class DatabaseManager:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
+            # WAL lets readers run alongside scraper writes; persists in the file
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Main events table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS events (
@@ -97,10 +104,16 @@ class DatabaseManager:
                     status TEXT,
                     scraped_at TEXT,
                     last_updated TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    content_hash TEXT
                 )
             """)
             
+            # Databases created before content_hash existed
+            columns = {row['name'] for row in cursor.execute("PRAGMA table_info(events)")}
+            if 'content_hash' not in columns:
+                cursor.execute("ALTER TABLE events ADD COLUMN content_hash TEXT")
+            
             # Tags table (many-to-many)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS event_tags (
@@ -132,8 +145,20 @@ class DatabaseManager:
                 )
             """)
             
+            # HTTP validators and parsed results for conditional detail fetches
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    result TEXT,
+                    updated_at TEXT
+                )
+            """)
+            
             # Create indexes for common queries
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_source ON events(source)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_url ON events(url)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_start_date ON events(start_date)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_status ON events(status)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_mode ON events(mode)")
@@ -164,8 +189,18 @@ class DatabaseManager:
                 END
             """)
             
+            # Only changes to indexed columns touch the FTS index, so the
+            # scraped_at-only refresh of unchanged events skips it. Databases
+            # created before this had an unconditional trigger; recreate it.
+            au_sql = cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'events_au'"
+            ).fetchone()
+            if au_sql and 'UPDATE OF' not in au_sql['sql']:
+                cursor.execute("DROP TRIGGER events_au")
+            
             cursor.execute("""
-                CREATE TRIGGER IF NOT EXISTS events_au AFTER UPDATE ON events BEGIN
+                CREATE TRIGGER IF NOT EXISTS events_au
+                AFTER UPDATE OF title, description, location, organizer ON events BEGIN
                     INSERT INTO events_fts(events_fts, rowid, title, description, location, organizer)
                     VALUES ('delete', OLD.rowid, OLD.title, OLD.description, OLD.location, OLD.organizer);
                     INSERT INTO events_fts(rowid, title, description, location, organizer)
@@ -185,59 +220,34 @@ class DatabaseManager:
         Returns:
             True if successful, False if skipped (ended/past deadline)
         """
-        # Filter out past events
-        if event.status == 'ended':
+        if not self._should_save(event):
             return False
-            
-        # Filter out events with past registration deadline
-        if event.registration_deadline:
-            try:
-                reg_deadline = datetime.strptime(event.registration_deadline, "%Y-%m-%d").date()
-                if reg_deadline < datetime.now().date():
-                    return False
-            except ValueError:
-                pass
 
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Upsert event
-            cursor.execute("""
-                INSERT OR REPLACE INTO events (
-                    id, source, title, url, start_date, end_date,
-                    registration_deadline, location, mode, description,
-                    prize_pool, prize_pool_numeric, image_url, logo_url,
-                    organizer, participants_count, team_size_min, team_size_max,
-                    status, scraped_at, last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.id, event.source, event.title, event.url,
-                event.start_date, event.end_date, event.registration_deadline,
-                event.location, event.mode, event.description,
-                event.prize_pool, event.prize_pool_numeric,
-                event.image_url, event.logo_url, event.organizer,
-                event.participants_count, event.team_size_min, event.team_size_max,
-                event.status, event.scraped_at, event.last_updated
-            ))
-            
-            # Update tags
-            cursor.execute("DELETE FROM event_tags WHERE event_id = ?", (event.id,))
-            for tag in event.tags:
-                cursor.execute(
-                    "INSERT OR IGNORE INTO event_tags (event_id, tag) VALUES (?, ?)",
-                    (event.id, tag)
-                )
-            
-            # Update themes
-            cursor.execute("DELETE FROM event_themes WHERE event_id = ?", (event.id,))
-            for theme in event.themes:
-                cursor.execute(
-                    "INSERT OR IGNORE INTO event_themes (event_id, theme) VALUES (?, ?)",
-                    (event.id, theme)
-                )
-            
+            self._write_events(conn.cursor(), [event])
             return True
     
+    def save_events_bulk(self, events: List[HackathonEvent]) -> int:
+        """
+        Save or update many events in a single transaction.
+        Applies the same filters as save_event.
+        
+        Args:
+            events: List of HackathonEvent objects
+            
+        Returns:
+            Number of events saved
+        """
+        # Last occurrence wins for duplicate IDs, as with repeated save_event calls
+        today = datetime.now().date()  # One clock read for the whole batch
+        to_save = list({e.id: e for e in events if self._should_save(e, today)}.values())
+        if not to_save:
+            return 0
+        
+        with self._get_connection() as conn:
+            self._write_events(conn.cursor(), to_save)
+        return len(to_save)
+    
     def save_events(self, events: List[HackathonEvent], source: str) -> int:
         """
         Save multiple events from a source.
@@ -250,16 +260,129 @@ class DatabaseManager:
         Returns:
             Number of events saved
         """
-        count = 0
-        for event in events:
-            if self.save_event(event):
-                count += 1
+        count = self.save_events_bulk(events)
         
         # Update scrape metadata
         self.update_scrape_metadata(source, count, True)
         
         return count
     
+    def _should_save(self, event: HackathonEvent, today: Optional[date] = None) -> bool:
+        """Skip ended events and events whose registration deadline has passed."""
+        # Filter out past events
+        if event.status == 'ended':
+            return False
+            
+        # Filter out events with past registration deadline
+        if event.registration_deadline:
+            try:
+                reg_deadline = datetime.strptime(event.registration_deadline, "%Y-%m-%d").date()
+                if reg_deadline < (today or datetime.now().date()):
+                    return False
+            except ValueError:
+                pass
+        
+        return True
+    
+    @staticmethod
+    def _event_row(event: HackathonEvent) -> tuple:
+        """Column values for the events table, in _write_events order (without scraped_at)."""
+        return (
+            event.id, event.source, event.title, event.url,
+            event.start_date, event.end_date, event.registration_deadline,
+            event.location, event.mode, event.description,
+            event.prize_pool, event.prize_pool_numeric,
+            event.image_url, event.logo_url, event.organizer,
+            event.participants_count, event.team_size_min, event.team_size_max,
+            event.status, event.last_updated
+        )
+    
+    @staticmethod
+    def _content_hash(row: tuple, event: HackathonEvent) -> str:
+        """Fingerprint of everything stored for an event except when it was scraped."""
+        return hashlib.blake2b(repr((row, event.tags, event.themes)).encode(), digest_size=8).hexdigest()
+    
+    def _stored_hashes(self, cursor, ids: List[str]) -> Dict[str, str]:
+        """content_hash of the given event IDs that are already stored."""
+        stored = {}
+        for i in range(0, len(ids), 500):  # Stay under SQLite's bound-parameter limit
+            chunk = ids[i:i + 500]
+            cursor.execute(
+                f"SELECT id, content_hash FROM events WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            stored.update((row['id'], row['content_hash']) for row in cursor.fetchall())
+        return stored
+    
+    def _write_events(self, cursor, events: List[HackathonEvent]):
+        """Upsert events and replace their tags/themes (caller commits).
+        Events whose content is unchanged since the last save only get scraped_at bumped."""
+        rows = [self._event_row(event) for event in events]
+        hashes = [self._content_hash(row, event) for row, event in zip(rows, events)]
+        stored = self._stored_hashes(cursor, [event.id for event in events])
+        
+        changed = []
+        unchanged = []
+        for row, content_hash, event in zip(rows, hashes, events):
+            if stored.get(event.id) == content_hash:
+                unchanged.append((event.scraped_at, event.id))
+            else:
+                changed.append((row, content_hash, event))
+        
+        cursor.executemany("UPDATE events SET scraped_at = ? WHERE id = ?", unchanged)
+        if not changed:
+            return
+        
+        # Upsert events in place: unlike INSERT OR REPLACE this keeps the rowid
+        # (so the FTS update trigger fires) and created_at
+        cursor.executemany("""
+            INSERT INTO events (
+                id, source, title, url, start_date, end_date,
+                registration_deadline, location, mode, description,
+                prize_pool, prize_pool_numeric, image_url, logo_url,
+                organizer, participants_count, team_size_min, team_size_max,
+                status, last_updated, scraped_at, content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                source = excluded.source,
+                title = excluded.title,
+                url = excluded.url,
+                start_date = excluded.start_date,
+                end_date = excluded.end_date,
+                registration_deadline = excluded.registration_deadline,
+                location = excluded.location,
+                mode = excluded.mode,
+                description = excluded.description,
+                prize_pool = excluded.prize_pool,
+                prize_pool_numeric = excluded.prize_pool_numeric,
+                image_url = excluded.image_url,
+                logo_url = excluded.logo_url,
+                organizer = excluded.organizer,
+                participants_count = excluded.participants_count,
+                team_size_min = excluded.team_size_min,
+                team_size_max = excluded.team_size_max,
+                status = excluded.status,
+                last_updated = excluded.last_updated,
+                scraped_at = excluded.scraped_at,
+                content_hash = excluded.content_hash
+        """, [row + (event.scraped_at, content_hash) for row, content_hash, event in changed])
+        
+        ids = [(event.id,) for _, _, event in changed]
+        
+        # Update tags
+        cursor.executemany("DELETE FROM event_tags WHERE event_id = ?", ids)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO event_tags (event_id, tag) VALUES (?, ?)",
+            [(event.id, tag) for _, _, event in changed for tag in event.tags]
+        )
+        
+        # Update themes
+        cursor.executemany("DELETE FROM event_themes WHERE event_id = ?", ids)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO event_themes (event_id, theme) VALUES (?, ?)",
+            [(event.id, theme) for _, _, event in changed for theme in event.themes]
+        )
+    
     def get_event(self, event_id: str) -> Optional[HackathonEvent]:
         """Get a single event by ID."""
         with self._get_connection() as conn:
@@ -546,6 +669,50 @@ class DatabaseManager:
             
             return [row['source'] for row in cursor.fetchall()]
     
+    def get_http_cache(self, url: str) -> Optional[Dict]:
+        """
+        Get stored HTTP validators and parsed result for a URL.
+        
+        Returns:
+            Dict with 'etag', 'last_modified' and 'result', or None
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT etag, last_modified, result FROM http_cache WHERE url = ?",
+                (url,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {
+                'etag': row['etag'],
+                'last_modified': row['last_modified'],
+                'result': json.loads(row['result']) if row['result'] else None
+            }
+    
+    def save_http_cache(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        result: Dict
+    ):
+        """Store HTTP validators and the parsed result for a URL."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO http_cache
+                (url, etag, last_modified, result, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                url,
+                etag,
+                last_modified,
+                json.dumps(result),
+                datetime.now().isoformat()
+            ))
+    
     # ============ Helper Methods ============
     
     def _row_to_event(self, row: Dict, cursor) -> HackathonEvent:
@@ -8,7 +8,7 @@ Maintains the same API as DatabaseManager for drop-in replacement.
 import os
 import json
 import pymysql
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from contextlib import contextmanager
 
@@ -133,6 +133,34 @@ class TiDBManager:
     
     def save_event(self, event: HackathonEvent) -> bool:
         """Save or update a single event."""
+        if not self._should_save(event):
+            return False
+
+        with self._get_connection() as conn:
+            self._write_events(conn.cursor(), [event])
+            return True
+    
+    def save_events_bulk(self, events: List[HackathonEvent]) -> int:
+        """Save or update many events in a single transaction."""
+        # Last occurrence wins for duplicate IDs, as with repeated save_event calls
+        today = datetime.now().date()  # One clock read for the whole batch
+        to_save = list({e.id: e for e in events if self._should_save(e, today)}.values())
+        if not to_save:
+            return 0
+        
+        with self._get_connection() as conn:
+            self._write_events(conn.cursor(), to_save)
+        return len(to_save)
+    
+    def save_events(self, events: List[HackathonEvent], source: str) -> int:
+        """Save multiple events from a source."""
+        count = self.save_events_bulk(events)
+        
+        self.update_scrape_metadata(source, count, True)
+        return count
+    
+    def _should_save(self, event: HackathonEvent, today: Optional[date] = None) -> bool:
+        """Skip ended events and events whose registration deadline has passed."""
         # Filter out past events
         if event.status == 'ended':
             return False
@@ -141,81 +169,71 @@ class TiDBManager:
         if event.registration_deadline:
             try:
                 reg_deadline = datetime.strptime(event.registration_deadline, "%Y-%m-%d").date()
-                if reg_deadline < datetime.now().date():
+                if reg_deadline < (today or datetime.now().date()):
                     return False
             except ValueError:
                 pass
-
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Upsert event (MySQL ON DUPLICATE KEY UPDATE)
-            cursor.execute("""
-                INSERT INTO events (
-                    id, source, title, url, start_date, end_date,
-                    registration_deadline, location, mode, description,
-                    prize_pool, prize_pool_numeric, image_url, logo_url,
-                    organizer, participants_count, team_size_min, team_size_max,
-                    status, scraped_at, last_updated
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                    source = VALUES(source),
-                    title = VALUES(title),
-                    url = VALUES(url),
-                    start_date = VALUES(start_date),
-                    end_date = VALUES(end_date),
-                    registration_deadline = VALUES(registration_deadline),
-                    location = VALUES(location),
-                    mode = VALUES(mode),
-                    description = VALUES(description),
-                    prize_pool = VALUES(prize_pool),
-                    prize_pool_numeric = VALUES(prize_pool_numeric),
-                    image_url = VALUES(image_url),
-                    logo_url = VALUES(logo_url),
-                    organizer = VALUES(organizer),
-                    participants_count = VALUES(participants_count),
-                    team_size_min = VALUES(team_size_min),
-                    team_size_max = VALUES(team_size_max),
-                    status = VALUES(status),
-                    scraped_at = VALUES(scraped_at),
-                    last_updated = VALUES(last_updated)
-            """, (
-                event.id, event.source, event.title, event.url,
-                event.start_date, event.end_date, event.registration_deadline,
-                event.location, event.mode, event.description,
-                event.prize_pool, event.prize_pool_numeric,
-                event.image_url, event.logo_url, event.organizer,
-                event.participants_count, event.team_size_min, event.team_size_max,
-                event.status, event.scraped_at, event.last_updated
-            ))
-            
-            # Update tags
-            cursor.execute("DELETE FROM event_tags WHERE event_id = %s", (event.id,))
-            for tag in event.tags:
-                cursor.execute(
-                    "INSERT IGNORE INTO event_tags (event_id, tag) VALUES (%s, %s)",
-                    (event.id, tag)
-                )
-            
-            # Update themes
-            cursor.execute("DELETE FROM event_themes WHERE event_id = %s", (event.id,))
-            for theme in event.themes:
-                cursor.execute(
-                    "INSERT IGNORE INTO event_themes (event_id, theme) VALUES (%s, %s)",
-                    (event.id, theme)
-                )
-            
-            return True
+        
+        return True
     
-    def save_events(self, events: List[HackathonEvent], source: str) -> int:
-        """Save multiple events from a source."""
-        count = 0
-        for event in events:
-            if self.save_event(event):
-                count += 1
+    def _write_events(self, cursor, events: List[HackathonEvent]):
+        """Upsert events and replace their tags/themes (caller commits)."""
+        # Upsert events (MySQL ON DUPLICATE KEY UPDATE); pymysql batches
+        # executemany INSERTs into multi-row statements
+        cursor.executemany("""
+            INSERT INTO events (
+                id, source, title, url, start_date, end_date,
+                registration_deadline, location, mode, description,
+                prize_pool, prize_pool_numeric, image_url, logo_url,
+                organizer, participants_count, team_size_min, team_size_max,
+                status, scraped_at, last_updated
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                source = VALUES(source),
+                title = VALUES(title),
+                url = VALUES(url),
+                start_date = VALUES(start_date),
+                end_date = VALUES(end_date),
+                registration_deadline = VALUES(registration_deadline),
+                location = VALUES(location),
+                mode = VALUES(mode),
+                description = VALUES(description),
+                prize_pool = VALUES(prize_pool),
+                prize_pool_numeric = VALUES(prize_pool_numeric),
+                image_url = VALUES(image_url),
+                logo_url = VALUES(logo_url),
+                organizer = VALUES(organizer),
+                participants_count = VALUES(participants_count),
+                team_size_min = VALUES(team_size_min),
+                team_size_max = VALUES(team_size_max),
+                status = VALUES(status),
+                scraped_at = VALUES(scraped_at),
+                last_updated = VALUES(last_updated)
+        """, [(
+            event.id, event.source, event.title, event.url,
+            event.start_date, event.end_date, event.registration_deadline,
+            event.location, event.mode, event.description,
+            event.prize_pool, event.prize_pool_numeric,
+            event.image_url, event.logo_url, event.organizer,
+            event.participants_count, event.team_size_min, event.team_size_max,
+            event.status, event.scraped_at, event.last_updated
+        ) for event in events])
         
-        self.update_scrape_metadata(source, count, True)
-        return count
+        ids = [(event.id,) for event in events]
+        
+        # Update tags
+        cursor.executemany("DELETE FROM event_tags WHERE event_id = %s", ids)
+        cursor.executemany(
+            "INSERT IGNORE INTO event_tags (event_id, tag) VALUES (%s, %s)",
+            [(event.id, tag) for event in events for tag in event.tags]
+        )
+        
+        # Update themes
+        cursor.executemany("DELETE FROM event_themes WHERE event_id = %s", ids)
+        cursor.executemany(
+            "INSERT IGNORE INTO event_themes (event_id, theme) VALUES (%s, %s)",
+            [(event.id, theme) for event in events for theme in event.themes]
+        )
     
     def get_event(self, event_id: str) -> Optional[HackathonEvent]:
         """Get a single event by ID."""
@@ -4,21 +4,42 @@ Multi-Site Hackathon Scraper - Consolidated
 Single entry point for all hackathon scraping logic.
 Combines API-based scraping (fast) and Browser-based scraping (robust).
 """
+import os
 import sys
 import re
 import json
+import random
+import functools
+import contextlib
+import threading
 import time
+import traceback
 import requests
-from datetime import datetime, timedelta
-from urllib.parse import urljoin, urlparse
+from collections import OrderedDict
+from types import MappingProxyType
+from datetime import date, datetime, timedelta
+from html import unescape as html_unescape
+from urllib.parse import urljoin, urlparse, urlsplit
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from lxml import etree, html as lxml_html
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+    def sync_playwright():
+        # Browser scrapers catch this and report it like any other failure
+        raise ImportError("Playwright not installed. Run: pip install playwright && playwright install chromium")
 
 # Add local path
 sys.path.insert(0, '.')
 
 from database.db_manager import DatabaseManager
 from utils.data_normalizer import DataNormalizer
+from utils.http_client import create_session, fetch_pages, json_loads
 
 # Initialize global objects
 headers = {
@@ -28,92 +49,511 @@ headers = {
 db = DatabaseManager('hackathons.db')
 normalizer = DataNormalizer()
 
+# Per-card debug output (set HACKFIND_DEBUG=1 to enable)
+DEBUG = os.environ.get('HACKFIND_DEBUG')
+
+# Wall-clock budget (seconds) for the whole scraper pool in main(); Kaggle's
+# 50 detail pages are the slowest legitimate run. Scrapers stop starting
+# detail fetches once it is spent; main() then allows SCRAPER_GRACE for
+# in-flight requests and saves before abandoning whatever is still running.
+SCRAPER_TIMEOUT = 240
+SCRAPER_GRACE = 30
+
+# Default Playwright timeouts (ms) so no click or wait can run unbounded
+BROWSER_ACTION_TIMEOUT = 15000
+BROWSER_NAVIGATION_TIMEOUT = 25000
+
+# time.monotonic() at which main()'s budget runs out; None outside main()
+_deadline = None
+
+def _out_of_time():
+    """True once main()'s scraper budget is spent"""
+    return _deadline is not None and time.monotonic() >= _deadline
+
+# Shared keep-alive session so detail fetches reuse connections per host
+# Detail workers queue for a warm connection; the Devfolio search POST is a
+# read, so it is retried like a GET
+SESSION = create_session(headers, pool_block=True, retry_post=True)
+
+# Scrapers read anchors and text only; these never need to be downloaded
+_BLOCKED_RESOURCES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        route.abort()
+    else:
+        route.continue_()
+
+@contextlib.contextmanager
+def _browser_page(**context_options):
+    """
+    Headless Chromium page in a fresh browser context; the browser is closed
+    on exit even if the scraper raises.
+    
+    Playwright's sync API is bound to the thread that started it and main()
+    runs every scraper in its own thread, so each browser scraper launches its
+    own browser. Per-site options (user_agent, viewport, ...) go to the context.
+    Images, media, fonts and stylesheets are aborted before they are fetched.
+    """
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            context = browser.new_context(**context_options)
+            context.set_default_timeout(BROWSER_ACTION_TIMEOUT)
+            context.set_default_navigation_timeout(BROWSER_NAVIGATION_TIMEOUT)
+            context.route('**/*', _block_heavy_resources)
+            yield context.new_page()
+        finally:
+            browser.close()
+
+def _goto_listing(page, url, selector, timeout=25000):
+    """
+    Open a JS-rendered listing and wait for its cards to appear rather than
+    for network idle, which analytics/chat polling can hold off until the
+    timeout. A short, bounded idle wait then lets the first lazy batch settle.
+    """
+    page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+    try: page.wait_for_selector(selector, timeout=15000)
+    except Exception: pass  # Parse whatever did render
+    try: page.wait_for_load_state('networkidle', timeout=5000)
+    except Exception: pass
+
+# In-page extraction: return only the card fields instead of shipping the
+# whole rendered DOM back through page.content()
+_JS_NODE_TEXT = """
+    // Non-empty text nodes joined by sep, like BeautifulSoup's get_text(sep, strip=True)
+    const nodeText = (el, sep) => {
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+            const t = n.nodeValue.trim();
+            if (t) parts.push(t);
+        }
+        return parts.join(sep);
+    };
+"""
+_JS_HACKQUEST_CARDS = """anchors => {%s
+    return anchors.map(a => {
+        const h2 = a.querySelector('h2');
+        return {href: a.getAttribute('href') || '', title: h2 ? nodeText(h2, '') : ''};
+    });
+}""" % _JS_NODE_TEXT
+# DevDisplay card is the second <div> enclosing an "Apply Now" link
+_JS_DEVDISPLAY_CARDS = """anchors => {%s
+    const out = [];
+    for (const a of anchors) {
+        if (!nodeText(a, '').toLowerCase().includes('apply now')) continue;
+        const inner = a.parentElement && a.parentElement.closest('div');
+        const card = inner && inner.parentElement && inner.parentElement.closest('div');
+        const h2 = card && card.querySelector('h2');
+        out.push({
+            href: a.getAttribute('href') || '',
+            found: !!card,
+            title: h2 ? nodeText(h2, '') : '',
+            id: card ? card.id : '',
+            text: card ? nodeText(card, ' ') : '',
+        });
+    }
+    return out;
+}""" % _JS_NODE_TEXT
+
 # ==========================================
 # Metadata Extraction Helpers
 # ==========================================
 
+# Precompiled patterns shared by the detail helpers and scrapers
+_RE_WS = re.compile(r'\s+')
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+# First JSON-LD block, matched on raw response bytes
+_RE_JSONLD = re.compile(rb'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+_RE_DIGITS = re.compile(r'\d+')
+_RE_PRIZE = re.compile(r'\$[\d,]+')
+_RE_CURRENCY_PRIZE = re.compile(r'([\$\£\€][\d,]+)')
+_RE_TEAMS = re.compile(r'([\d,]+)\s+Teams?', re.IGNORECASE)
+_RE_TEAMSIZE = re.compile(r'Team\s*Size:?\s*(\d+)(?:\s*[-–]\s*(\d+))?', re.IGNORECASE)
+_RE_REGISTERED = re.compile(r'([\d,]+)\s+registered', re.IGNORECASE)
+
+# Listing cards put dates/prize/participants up front; no need to scan more
+_CARD_TEXT_LIMIT = 500
+
+# One-pass card text patterns: participants, start date and prize
+_RE_TECHGIG_CARD = re.compile(
+    r'(?P<parts>\d+)\s+Registered'
+    r'|(?P<date>[A-Za-z]{3}\s+\d{1,2},\s+\d{4})'
+    r'|(?P<prize>[₹$]\s?[\d,]+)',
+    re.IGNORECASE
+)
+_RE_HACKEREARTH_CARD = re.compile(
+    r'(?P<parts>[\d,]+)\+?\s+Registered'
+    r'|(?:Starts on|STARTS ON)\s*:?\s*(?P<date>[A-Za-z]{3}\s+\d{1,2},\s+\d{2,4})'
+    r'|(?P<prize>[₹$]\s?[\d,]+)',
+    re.IGNORECASE
+)
+
+# Devfolio slug from "slug.devfolio.co" or "(www.)devfolio.co/slug"; Unstop ID from "...-154300" or "...-154300/"
+_RE_DEVFOLIO = re.compile(r'https?://(?:(?!www\.)([^./]+)\.devfolio\.co|(?:www\.)?devfolio\.co/([^/?]+))')
+_RE_UNSTOP = re.compile(r'-(\d+)/?$')
+
+# GeeksforGeeks event cards: "February 24, 2025"; rupee/dollar card prizes: "₹10,000"
+_RE_CARD_PRIZE = re.compile(r'[₹$]\s?[\d,]+')
+_RE_GFG_CARD = re.compile(
+    r'(?P<date>(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4})'
+    r'|(?P<prize>[₹$]\s?[\d,]+)'
+)
+_RE_PARTICIPANTS = re.compile(r'(\d+)\s+Participants?', re.IGNORECASE)
+
+# DevDisplay cards: "Sep 20 - 21" and "Bengaluru, India"
+_RE_DEVDISPLAY_DATE = re.compile(r'([A-Z][a-z]{2})\s+(\d{1,2})\s*[-–]\s*(\d{1,2})')
+_RE_INDIA_LOCATION = re.compile(r'([A-Za-z]+,?\s*India)')
+
+# Kaggle listing "N days to go", detail-page deadline (in priority order) and team size
+_RE_KAGGLE_DAYS_LEFT = re.compile(r'(\d+)\s+days?\s+to\s+go', re.IGNORECASE)
+_RE_KAGGLE_DEADLINES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Deadline[:\s]+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
+    r'Ends?\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
+    r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s+(?:deadline|ends?)',
+))
+_RE_KAGGLE_TEAM = re.compile(r'(?:team\s+size|members?)[:\s]+(?:up\s+to\s+)?(\d+)', re.IGNORECASE)
+_RE_KAGGLE_TEAM_RANGE = re.compile(r'(\d+)\s*[-–]\s*(\d+)\s+(?:team\s+)?members?', re.IGNORECASE)
+
+# MLH event cards: "May 5", "May 5th", "May 5 - 7", "May 5 - May 7"; "City, State"
+_RE_MLH_DATE = re.compile(
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?'
+    r'(?:\s*[-–]\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?(\d{1,2}))?',
+    re.IGNORECASE
+)
+_RE_MLH_LOCATION = re.compile(r'([A-Z][a-zA-Z\s\.]+,\s*[A-Z][a-zA-Z\s\.]+)')
+
+# Devpost submission_period_dates in one scan: a range ("Jan 5 - 9, 2025",
+# "Jan 30 - Feb 2, 2025") or full dates ("Jan 5, 2025 - Feb 2, 2026")
+_RE_DEVPOST_DATES = re.compile(
+    r'(?P<mon1>[A-Za-z]{3})\s+(?P<d1>\d{1,2})\s*-\s*(?:(?P<mon2>[A-Za-z]{3})\s+)?(?P<d2>\d{1,2}),\s+(?P<y>\d{4})'
+    r'|(?P<fmon>[A-Za-z]{3})\s+(?P<fd>\d{1,2}),\s+(?P<fy>\d{4})'
+)
+
+def _devfolio_slug(url):
+    """Extract the hackathon slug from a Devfolio URL, or None"""
+    m = _RE_DEVFOLIO.search(url)
+    return (m.group(1) or m.group(2)) if m else None
+
+def _scan_card_text(text, pattern):
+    """Return the first match of each named group in pattern, in one finditer pass"""
+    found = {}
+    for m in pattern.finditer(text):
+        found.setdefault(m.lastgroup, m.group(m.lastgroup))
+        if len(found) == len(pattern.groupindex):
+            break
+    return found
+
+def _lx_text(el, separator=''):
+    """lxml equivalent of BeautifulSoup's get_text(separator, strip=True),
+    which also leaves out <script> and <style> contents"""
+    return separator.join(t for t in (s.strip() for s in _XP_NODE_TEXT(el)) if t)
+
+def _lx_first(el, xpath):
+    """First node matched by a compiled XPath, or None"""
+    found = xpath(el)
+    return found[0] if found else None
+
+def _xp_class(name):
+    """XPath predicate matching elements whose class list contains name"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+# Compiled once; etree.XPath objects skip re-parsing the expression per call
+# Plain strings: "smart" results would keep a parent reference per text node
+_XP_PAGE_TEXT = etree.XPath('//text()[not(ancestor::script or ancestor::style)]', smart_strings=False)
+_XP_NODE_TEXT = etree.XPath('.//text()[not(ancestor::script or ancestor::style)]', smart_strings=False)
+# Devpost detail nodes in one pass: description containers (in priority
+# order: .content, #content, .challenge-description, .software-body),
+# paragraphs, and eligibility requirement items
+_DEVPOST_CONTENT_CLASSES = ('content', None, 'challenge-description', 'software-body')
+_XP_DEVPOST_NODES = etree.XPath(
+    f'//*[{_xp_class("content")} or @id="content" or {_xp_class("challenge-description")} or {_xp_class("software-body")}]'
+    f' | //p'
+    f' | //li[ancestor::*[{_xp_class("requirements-col")} or {_xp_class("requirements")}]]'
+)
+_XP_DEVFOLIO_CHROME = etree.XPath('//nav | //header | //footer | //script | //style')
+_XP_DEVFOLIO_BLOCKS = etree.XPath('//p | //h1 | //h2 | //h3 | //li')
+_XP_DORAHACKS_CARDS = etree.XPath('//a[contains(@href, "/hackathon/")]')
+_XP_DORAHACKS_TITLE = etree.XPath(f'.//*[{_xp_class("font-semibold")}] | .//h3 | .//h4')
+_XP_DORAHACKS_TITLE_DIV = etree.XPath('.//div[contains(translate(@class, "TITLE", "title"), "title")]')
+_XP_TECHGIG_LINKS = etree.XPath('//a[contains(@href, "/hackathon") or contains(@href, "/challenge")]')
+_XP_HEADINGS = etree.XPath('.//h2 | .//h3 | .//h4 | .//h5')
+_XP_LINKS = etree.XPath('//a[@href]')
+_XP_KAGGLE_LINKS = etree.XPath(
+    '//a[(contains(@href, "/competitions/") or contains(@href, "/c/"))'
+    ' and not(contains(@href, "about") or contains(@href, "documentation"))]'
+)
+_XP_OG_DESCRIPTION = etree.XPath('//meta[@property="og:description"]/@content', smart_strings=False)
+_XP_TITLE = etree.XPath('//title/text()', smart_strings=False)
+
+_RE_CHARSET = re.compile(r'charset=["\']?([\w-]+)', re.IGNORECASE)
+
+def _lx_parse_response(r):
+    """
+    Parse a response body straight from bytes so it is decoded only once.
+    
+    Uses the Content-Type charset when the server sends one; otherwise
+    libxml2 reads the <meta charset> declaration itself.
+    """
+    m = _RE_CHARSET.search(r.headers.get('Content-Type', ''))
+    parser = lxml_html.HTMLParser(encoding=m.group(1)) if m else None
+    return lxml_html.fromstring(r.content, parser=parser)
+
+def _lx_page_text(tree):
+    """lxml equivalent of BeautifulSoup's get_text() on a whole page (skips script/style)"""
+    return ''.join(_XP_PAGE_TEXT(tree))
+
+class _LinkCollector:
+    """
+    lxml parser target that keeps only matching <a> tags and their text.
+    
+    Used where a scraper needs nothing but the links, so no document tree
+    is built and memory stays proportional to the number of matches.
+    """
+    
+    def __init__(self, href_filter):
+        self.href_filter = href_filter
+        self.links = []       # (href, [stripped text strings]) per anchor
+        self._current = None
+        self._depth = 0
+        self._buf = []
+    
+    def _flush(self):
+        # Text nodes may arrive in several data() calls; strip them as a whole
+        if self._buf:
+            text = ''.join(self._buf).strip()
+            self._buf = []
+            if text: self._current[1].append(text)
+    
+    def start(self, tag, attrib):
+        if self._current is not None:
+            self._flush()
+            if tag == 'a': self._depth += 1
+        elif tag == 'a':
+            href = attrib.get('href')
+            if href and self.href_filter(href):
+                self._current = (href, [])
+                self._depth = 1
+    
+    def end(self, tag):
+        if self._current is not None:
+            self._flush()
+            if tag == 'a':
+                self._depth -= 1
+                if not self._depth:
+                    self.links.append(self._current)
+                    self._current = None
+    
+    def data(self, data):
+        if self._current is not None:
+            self._buf.append(data)
+    
+    def close(self):
+        return self.links
+
+def _collect_links(html, href_filter):
+    """Stream-parse html and return (href, text strings) for matching anchors"""
+    parser = lxml_html.HTMLParser(target=_LinkCollector(href_filter))
+    parser.feed(html)
+    return parser.close()
+
+def _is_new_link(seen, href):
+    """
+    Record href in seen and return True unless an equivalent link was already
+    there. Links compare by host and path (trailing slash ignored) plus any
+    query other than tracking params, so "/hackathon/x?utm_source=a" and
+    "/hackathon/x/" count as one event.
+    """
+    p = urlsplit(href)
+    query = '&'.join(q for q in p.query.split('&') if q and not q.startswith(('utm_', 'ref=')))
+    key = (p.netloc.lower(), p.path.rstrip('/'), query)
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
+
 def clean_html(html_text):
     """Remove HTML tags and clean text"""
     if not html_text:
         return ""
-    soup = BeautifulSoup(html_text, 'html.parser')
-    text = soup.get_text(separator=' ', strip=True)
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # Short API fragments: strip tags and decode entities without building a tree
+    return _RE_WS.sub(' ', html_unescape(_RE_HTML_TAG.sub(' ', html_text))).strip()
+
+# Common tech keywords to look for
+_TAG_KEYWORDS = [
+    'AI', 'ML', 'machine learning', 'blockchain', 'web3', 'crypto',
+    'mobile', 'app', 'android', 'ios', 'web', 'frontend', 'backend',
+    'cloud', 'security', 'cybersecurity', 'data', 'IoT', 'AR', 'VR',
+    'gaming', 'fintech', 'healthcare', 'education', 'sustainability',
+    'beginner', 'student', 'online', 'virtual', 'remote'
+]
+# Lowercased keyword (or "word word" bigram) -> display form; text is tokenized
+# once and each token (or its singular) looked up, so cost doesn't grow with
+# the keyword list. Whole tokens only: "AR" doesn't fire inside "art".
+_TAG_CANON = {kw.lower(): kw for kw in _TAG_KEYWORDS}
+_TAG_BIGRAM_HEADS = frozenset(kw.split()[0] for kw in _TAG_CANON if ' ' in kw)
+_RE_WORD = re.compile(r'\w+')
+
+# Devfolio domain themes, matched the same way
+_DEVFOLIO_DOMAINS = [
+    'AI', 'Machine Learning', 'Web3', 'Blockchain', 'Cloud', 
+    'Security', 'FinTech', 'Healthcare', 'IoT', 'AR/VR',
+    'Mobile', 'Open Innovation', 'Social Good', 'Education'
+]
+_DEVFOLIO_DOMAIN_CANON = {kw.lower(): kw for kw in _DEVFOLIO_DOMAINS}
+_RE_DEVFOLIO_DOMAINS = re.compile(
+    r'\b(' + '|'.join(re.escape(kw) for kw in sorted(_DEVFOLIO_DOMAINS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
 
 def extract_tags_from_text(text, max_tags=10):
     """Extract relevant keywords as tags from text"""
     if not text:
         return []
+    # Taglines/descriptions repeat across listings and detail fallbacks
+    return list(_extract_tags_cached(text, max_tags))
+
+@functools.lru_cache(maxsize=2048)
+def _extract_tags_cached(text, max_tags):
+    hits = set()
+    prev = None
     
-    # Common tech keywords to look for
-    keywords = [
-        'AI', 'ML', 'machine learning', 'blockchain', 'web3', 'crypto',
-        'mobile', 'app', 'android', 'ios', 'web', 'frontend', 'backend',
-        'cloud', 'security', 'cybersecurity', 'data', 'IoT', 'AR', 'VR',
-        'gaming', 'fintech', 'healthcare', 'education', 'sustainability',
-        'beginner', 'student', 'online', 'virtual', 'remote'
-    ]
-    
-    text_lower = text.lower()
-    found_tags = []
-    
-    for kw in keywords:
-        if kw.lower() in text_lower and kw not in found_tags:
-            found_tags.append(kw)
-            if len(found_tags) >= max_tags:
-                break
+    for m in _RE_WORD.finditer(text):
+        tok = m.group().lower()
+        kw = _TAG_CANON.get(f'{prev} {tok}') if prev in _TAG_BIGRAM_HEADS else None
+        prev = tok
+        if kw is None:
+            kw = _TAG_CANON.get(tok)
+            if kw is None and tok.endswith('s'):
+                kw = _TAG_CANON.get(tok[:-1])  # Plurals: "apps", "students"
+            if kw is None: continue
+        hits.add(kw)
     
-    return found_tags
+    # Keyword-table order, so max_tags keeps the same subset whatever the text order
+    return tuple([kw for kw in _TAG_KEYWORDS if kw in hits][:max_tags])
 
 # ==========================================
 # Detail Page Scrapers
 # ==========================================
 
+_DETAILS_CACHE_SIZE = 4096
+
+def _memoize_details(func):
+    """
+    Cache successful detail lookups by URL/slug/ID for the life of the process.
+    
+    Failures (None) are not cached so a later call can retry. The same
+    object is handed to every caller, so results are returned read-only.
+    """
+    cache = OrderedDict()
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper(key):
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        result = func(key)
+        if result is None:
+            return None
+        result = MappingProxyType(result)
+        with lock:
+            cache[key] = result
+            if len(cache) > _DETAILS_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+    
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+def _conditional_get(url, timeout=10):
+    """
+    GET url with the ETag/Last-Modified validators stored by the last run.
+    
+    Returns (response, cached_result). cached_result is set only when the
+    server answered 304 Not Modified, in which case parsing can be skipped.
+    """
+    cached = db.get_http_cache(url)
+    req_headers = {}
+    if cached:
+        if cached['etag']: req_headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']: req_headers['If-Modified-Since'] = cached['last_modified']
+    
+    r = SESSION.get(url, headers=req_headers, timeout=timeout)
+    if r.status_code == 304 and cached and cached['result'] is not None:
+        return r, cached['result']
+    return r, None
+
+def _remember_response(url, r, result):
+    """Store validators and the parsed result of a 200 response, if it has any"""
+    etag = r.headers.get('ETag')
+    last_modified = r.headers.get('Last-Modified')
+    if etag or last_modified:
+        db.save_http_cache(url, etag, last_modified, result)
+    return result
+
+@_memoize_details
 def scrape_devpost_details(event_url):
     """Scrape description, tags, themes from Devpost event page"""
     try:
-        r = requests.get(event_url, headers=headers, timeout=10)
+        r, cached = _conditional_get(event_url)
+        if cached is not None:
+            return cached
         if r.status_code != 200:
             return None
         
-        soup = BeautifulSoup(r.text, 'html.parser')
+        tree = _lx_parse_response(r)
+        
+        # Sort the single-pass node list into its three uses
+        contents = {}       # priority -> first matching container
+        paragraphs = []
+        requirements = []
+        for el in _XP_DEVPOST_NODES(tree):
+            classes = (el.get('class') or '').split()
+            is_content = False
+            for rank, cls in enumerate(_DEVPOST_CONTENT_CLASSES):
+                if (cls in classes) if cls else (el.get('id') == 'content'):
+                    contents.setdefault(rank, el)
+                    is_content = True
+            if el.tag == 'p':
+                paragraphs.append(el)
+            elif el.tag == 'li' and not is_content:
+                requirements.append(el)
         
         # Description from .content or fallback to large text blocks
         description = ""
-        for selector in ['.content', '#content', '.challenge-description', '.software-body']:
-            content = soup.select_one(selector)
-            if content:
-                description = content.get_text(separator=' ', strip=True)[:1000]
+        for rank in range(len(_DEVPOST_CONTENT_CLASSES)):
+            content = contents.get(rank)
+            if content is not None:
+                description = _lx_text(content, ' ')[:1000]
                 if len(description) > 50:  # Found meaningful content
                     break
         
         # Fallback: get all paragraphs
         if len(description) < 50:
-            paragraphs = soup.select('p')
-            description = ' '.join([p.get_text(strip=True) for p in paragraphs[:10]])[:1000]
+            description = ' '.join([_lx_text(p) for p in paragraphs[:10]])[:1000]
         
-        # Tags from eligibility requirements
-        tags = []
-        requirements = soup.select('.requirements-col li, .requirements li')
+        # Tags from eligibility requirements (ordered, deduplicated)
+        tags = {}
         for req in requirements:
-            text = req.get_text(strip=True).lower()
-            if 'student' in text: tags.append('student')
-            if 'beginner' in text: tags.append('beginner')
-            if 'college' in text: tags.append('student')
+            text = _lx_text(req).lower()
+            if 'student' in text or 'college' in text: tags['student'] = None
+            if 'beginner' in text: tags['beginner'] = None
         
-        # Extract more tags from description
-        tags.extend(extract_tags_from_text(description))
-        tags = list(set(tags))[:10]  # Deduplicate and limit
+        # Top up with description tags; extraction stops once the limit is reachable
+        for tag in extract_tags_from_text(description, max_tags=10):
+            if len(tags) >= 10: break
+            tags.setdefault(tag)
+        tags = list(tags)
         
         # Themes from JSON-LD metadata
         themes = []
-        jsonld = soup.select_one('script[type="application/ld+json"]')
+        jsonld = _RE_JSONLD.search(r.content)
         if jsonld:
             try:
-                import json
-                data = json.loads(jsonld.string)
+                data = json_loads(jsonld.group(1))
                 if isinstance(data, dict):
                     # Try to get keywords or category
                     if data.get('keywords'):
@@ -123,8 +563,9 @@ def scrape_devpost_details(event_url):
                 
         # Scrape Team Size from Text
         team_size = None
-        ts_text = soup.get_text()
-        ts_match = re.search(r'Team\s*Size:?\s*(\d+)(?:\s*[-–]\s*(\d+))?', ts_text, re.IGNORECASE)
+        ts_text = _lx_page_text(tree)
+        ts_lower = ts_text.lower()
+        ts_match = _RE_TEAMSIZE.search(ts_text)
         if ts_match:
             min_s = ts_match.group(1)
             max_s = ts_match.group(2)
@@ -132,14 +573,14 @@ def scrape_devpost_details(event_url):
 
         # Scrape Participants count
         participants = None
-        p_match = re.search(r'([\d,]+)\s+registered', ts_text, re.IGNORECASE)
+        p_match = _RE_REGISTERED.search(ts_text)
         if p_match:
             participants = int(p_match.group(1).replace(',', ''))
 
         # Scrape Prize (Total)
         prize = None
-        prize_match = re.search(r'([\$\£\€][\d,]+)', ts_text)
-        if prize_match and 'prize' in ts_text.lower():
+        prize_match = _RE_CURRENCY_PRIZE.search(ts_text)
+        if prize_match and 'prize' in ts_lower:
              prize = prize_match.group(1)
 
         # Scrape Location/Mode
@@ -147,14 +588,14 @@ def scrape_devpost_details(event_url):
         mode = None
         
         # Check metadata sidebar or header
-        if 'online' in ts_text.lower() or 'virtual' in ts_text.lower():
+        if 'online' in ts_lower or 'virtual' in ts_lower:
              mode = 'online'
              if not location: location = 'Online'
         
         # Try to find date meta tags if available, otherwise rely on text
         # (Dates are usually parsed from listing, but detail page helps if listing failed)
         
-        return {
+        return _remember_response(event_url, r, {
             'description': description, 
             'tags': tags, 
             'themes': themes, 
@@ -163,56 +604,55 @@ def scrape_devpost_details(event_url):
             'prize': prize,
             'location': location,
             'mode': mode
-        }
+        })
         
         return {'description': description, 'tags': tags, 'themes': themes, 'team_size': team_size}
     except Exception as e:
         return None
 
+@_memoize_details
 def scrape_devfolio_details(event_slug):
     """Scrape description and domains from Devfolio event page"""
     try:
         url = f"https://{event_slug}.devfolio.co/overview"
-        r = requests.get(url, headers=headers, timeout=10)
+        r, cached = _conditional_get(url)
+        if cached is not None:
+            return cached
         if r.status_code != 200:
             return None
         
-        soup = BeautifulSoup(r.text, 'html.parser')
+        tree = _lx_parse_response(r)
         
         # Get page text, skip nav/header elements
         # Remove nav and header elements first
-        for nav in soup.select('nav, header, footer, script, style'):
-            nav.decompose()
+        for nav in _XP_DEVFOLIO_CHROME(tree):
+            nav.drop_tree()
         
         # Get main content paragraphs
         paragraphs = []
-        for p in soup.select('p, h1, h2, h3, li'):
-            text = p.get_text(strip=True)
+        for p in _XP_DEVFOLIO_BLOCKS(tree):
+            text = _lx_text(p)
             if len(text) > 30 and 'Overview' not in text and 'Prizes' not in text:
                 paragraphs.append(text)
         
         description = " ".join(paragraphs[:10])[:1000]
         
-        # Themes/Domains - look for domain keywords in full page text
-        themes = []
-        page_text = soup.get_text()
-        domain_keywords = [
-            'AI', 'Machine Learning', 'Web3', 'Blockchain', 'Cloud', 
-            'Security', 'FinTech', 'Healthcare', 'IoT', 'AR/VR',
-            'Mobile', 'Open Innovation', 'Social Good', 'Education'
-        ]
-        for kw in domain_keywords:
-            if kw.lower() in page_text.lower():
-                themes.append(kw)
-        themes = themes[:10]
+        # Themes/Domains - look for domain keywords in full page text,
+        # in order of first appearance
+        found = dict.fromkeys(
+            _DEVFOLIO_DOMAIN_CANON[m.group(1).lower()]
+            for m in _RE_DEVFOLIO_DOMAINS.finditer(tree.text_content())
+        )
+        themes = list(found)[:10]
         
         # Extract tags from description
         tags = extract_tags_from_text(description)
         
-        return {'description': description, 'tags': tags, 'themes': themes}
+        return _remember_response(url, r, {'description': description, 'tags': tags, 'themes': themes})
     except Exception as e:
         return None
 
+@_memoize_details
 def fetch_unstop_details_api(event_id):
     """
     Fetch details for a single event ID from Unstop API.
@@ -220,12 +660,12 @@ def fetch_unstop_details_api(event_id):
     """
     try:
         api_url = f"https://unstop.com/api/public/competition/{event_id}?round_lang=1"
-        r = requests.get(api_url, headers=headers, timeout=10)
+        r = SESSION.get(api_url, timeout=10)
         
         if r.status_code != 200:
             return None
         
-        data = r.json()
+        data = json_loads(r.content)
         comp = data.get('data', {}).get('competition', {})
         if not comp:
              return None
@@ -238,12 +678,7 @@ def fetch_unstop_details_api(event_id):
         reg_start_iso = reg_req.get('start_regn_dt')
         
         # Description
-        raw_desc = comp.get('details', '')
-        # Simple clean since we don't have the clean_html helper here, use BS4
-        description = ""
-        if raw_desc:
-            soup = BeautifulSoup(raw_desc, 'html.parser')
-            description = soup.get_text(separator=' ', strip=True)[:3000]
+        description = clean_html(comp.get('details', ''))[:3000]
             
         # Team Size
         ts_min = None
@@ -257,7 +692,7 @@ def fetch_unstop_details_api(event_id):
         if ts_min is None or ts_max is None:
             ts_str = reg_req.get('teamSize')
             if ts_str:
-                parts = re.findall(r'\d+', str(ts_str))
+                parts = _RE_DIGITS.findall(str(ts_str))
                 if len(parts) >= 2:
                     ts_min = int(parts[0])
                     ts_max = int(parts[1])
@@ -290,15 +725,24 @@ def fetch_unstop_details_api(event_id):
 # Parallel Scraper Helpers
 # ==========================================
 
-def fetch_details_parallel(items, fetch_func, max_workers=20):
+# lxml releases the GIL while parsing, so threads overlap parse with network
+# waits; sized to stay within SESSION's per-host connection pool
+DETAIL_WORKERS = 32
+
+def _fetch_in_time(fetch_func, url_or_id):
+    """fetch_func(url_or_id), or None once the scraper budget is spent"""
+    return None if _out_of_time() else fetch_func(url_or_id)
+
+def fetch_details_parallel(items, fetch_func, max_workers=DETAIL_WORKERS):
     """
     Fetch details for a list of items in parallel.
     items: list of dicts with 'url_or_id' key
     fetch_func: function that takes url_or_id and returns dict
+    Items still queued when the scraper budget runs out are skipped.
     """
     results = {}
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_item = {executor.submit(fetch_func, item['url_or_id']): item for item in items}
+        future_to_item = {executor.submit(_fetch_in_time, fetch_func, item['url_or_id']): item for item in items}
         
         for future in as_completed(future_to_item):
             item = future_to_item[future]
@@ -314,26 +758,48 @@ def fetch_details_parallel(items, fetch_func, max_workers=20):
 # Helpers
 # ==========================================
 
+_MON = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
+def _iso(mon, day, year):
+    """('Jan', '5', '2025') -> '2025-01-05' without strptime; KeyError/ValueError on bad input."""
+    return date(int(year), _MON[mon[:3].title()], int(day)).isoformat()
+
+@functools.lru_cache(maxsize=4096)
+def _parse_epoch_cached(ts):
+    if ts > 9999999999: ts = ts / 1000
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
+
 def parse_epoch(timestamp):
-    """Convert epoch timestamp to ISO date string."""
+    """Convert epoch timestamp to ISO date string (events often share the same timestamps)."""
     if not timestamp: return None
     try:
-        ts = int(timestamp)
-        if ts > 9999999999: ts = ts / 1000
-        return datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
-    except: return None
+        return _parse_epoch_cached(int(timestamp))
+    except (TypeError, ValueError, OverflowError, OSError): return None
 
 def parse_iso_timestamp(ts):
     """Parse ISO timestamp to date string."""
-    if not ts: return None
-    try:
-        if isinstance(ts, str): return ts[:10] if len(ts) >= 10 else None
-        return None
-    except: return None
+    # A plain slice; cheaper than any cache lookup
+    if isinstance(ts, str) and len(ts) >= 10: return ts[:10]
+    return None
 
 def safe_get(url, timeout=30):
-    try: return requests.get(url, headers=headers, timeout=timeout)
-    except: return None
+    try: return SESSION.get(url, timeout=timeout)
+    except requests.RequestException: return None
+
+def _save_batch(records):
+    """Save a scraper's normalized events in one transaction.
+    If the bulk write fails, fall back to row-by-row so one bad event doesn't drop the rest."""
+    if not records: return 0
+    try:
+        return db.save_events_bulk(records)
+    except Exception as e:
+        print(f'  Bulk save failed ({e}), saving individually...')
+        count = 0
+        for event in records:
+            try: count += db.save_event(event)
+            except Exception: pass
+        return count
 
 def _extract_jsonld_events(data, base_url):
     """Extract events from JSON-LD data."""
@@ -383,37 +849,32 @@ def _extract_jsonld_events(data, base_url):
 def scrape_devpost():
     print('\n📦 Devpost...')
     saved = 0
-    # Regex patterns
-    pat_full = re.compile(r'([A-Za-z]{3}\s+\d{1,2},\s+\d{4})')
-    pat_same_month = re.compile(r'([A-Za-z]{3})\s+(\d{1,2})\s*-\s*(\d{1,2}),\s+(\d{4})')
-    pat_diff_month = re.compile(r'([A-Za-z]{3})\s+(\d{1,2})\s*-\s*([A-Za-z]{3})\s+(\d{1,2}),\s+(\d{4})')
+    raws = []
     
     print(f'  Fetching pages...')
     
     # 1. Collect all events first
-    total_hackathons = []
-    
-    for page in range(1, 30):  # Increased limit to ~1500 events
+    def fetch_page(page):
         try:
             r = safe_get(f'https://devpost.com/api/hackathons?page={page}&per_page=50')
-            if not r: break
-            
-            hackathons = r.json().get('hackathons', [])
-            if not hackathons: break
-            
-            total_hackathons.extend(hackathons)
-        except: break
+            hackathons = json_loads(r.content).get('hackathons', []) if r else None
+            return hackathons if isinstance(hackathons, list) else None
+        except (ValueError, AttributeError, TypeError):
+            return None  # Not JSON (e.g. an error page) or not the expected shape
+    
+    total_hackathons = fetch_pages(fetch_page, range(1, 30))  # Up to ~1500 events
             
     print(f'  Found {len(total_hackathons)} events. Fetching details in parallel...')
     
-    # Prepare for parallel fetch
+    # Prepare for parallel fetch; rows whose listing already has a tagline,
+    # themes and team size use the listing data (see the fallback below)
     to_fetch = []
     for h in total_hackathons:
-        if h.get('url'):
+        if h.get('url') and not (h.get('tagline') and h.get('themes') and h.get('team_size')):
             to_fetch.append({'id': h['url'], 'url_or_id': h['url']})
     
     # Fetch details
-    details_map = fetch_details_parallel(to_fetch, scrape_devpost_details, max_workers=20)
+    details_map = fetch_details_parallel(to_fetch, scrape_devpost_details)
     
     # Save events with details
     saved = 0
@@ -435,28 +896,21 @@ def scrape_devpost():
                 end_date = parse_iso_timestamp(dates.get('ends_at'))
             elif isinstance(dates, str) and dates:
                 dates = dates.replace(u'\xa0', u' ').strip()
-                # Try Same Month
-                m2 = pat_same_month.search(dates)
-                if m2:
-                    mon, d1, d2, y = m2.groups()
-                    start_date = datetime.strptime(f"{mon} {d1}, {y}", '%b %d, %Y').strftime('%Y-%m-%d')
-                    end_date = datetime.strptime(f"{mon} {d2}, {y}", '%b %d, %Y').strftime('%Y-%m-%d')
-                # Try Diff Month
-                if not start_date:
-                    m3 = pat_diff_month.search(dates)
-                    if m3:
-                        mon1, d1, mon2, d2, y = m3.groups()
-                        start_date = datetime.strptime(f"{mon1} {d1}, {y}", '%b %d, %Y').strftime('%Y-%m-%d')
-                        end_date = datetime.strptime(f"{mon2} {d2}, {y}", '%b %d, %Y').strftime('%Y-%m-%d')
-                # Try Full
-                if not start_date:
-                    matches = pat_full.findall(dates)
-                    if matches:
-                        try:
-                            start_date = datetime.strptime(matches[0], '%b %d, %Y').strftime('%Y-%m-%d')
-                            if len(matches) > 1:
-                                end_date = datetime.strptime(matches[1], '%b %d, %Y').strftime('%Y-%m-%d')
-                        except: pass
+                it = _RE_DEVPOST_DATES.finditer(dates)
+                m = next(it, None)
+                try:
+                    if m and m.group('y'):
+                        # Range: same month ("Jan 5 - 9") or month pair ("Jan 30 - Feb 2")
+                        mon1, d1, mon2, d2, y = m.group('mon1', 'd1', 'mon2', 'd2', 'y')
+                        start_date = _iso(mon1, d1, y)
+                        end_date = _iso(mon2 or mon1, d2, y)
+                    elif m:
+                        # Full dates: start, then the next full date (if any) as end
+                        start_date = _iso(*m.group('fmon', 'fd', 'fy'))
+                        m = next(it, None)
+                        if m and m.group('fy'):
+                            end_date = _iso(*m.group('fmon', 'fd', 'fy'))
+                except (KeyError, ValueError): pass
             
             # Get details
             details = details_map.get(h.get('url'))
@@ -470,67 +924,72 @@ def scrape_devpost():
                 tags = extract_tags_from_text(description)
                 themes = h.get('themes', [])
             
+            online = h.get('online_only')
             raw = {
                 'title': h.get('title'),
                 'url': h.get('url'),
                 'start_date': start_date,
                 'end_date': end_date,
-                'location': 'Online' if h.get('online_only') else h.get('displayed_location', ''),
+                'location': 'Online' if online else h.get('displayed_location', ''),
                 'prize': h.get('prize_amount'),
-                'mode': 'online' if h.get('online_only') else 'in-person',
+                'mode': 'online' if online else 'in-person',
                 'participants_count': h.get('registrations_count'),
                 'description': description,
                 'tags': tags,
                 'themes': themes
             }
-            if raw['title']: db.save_event(normalizer.normalize(raw, 'Devpost')); saved += 1
+            if raw['title']: raws.append(raw); saved += 1
         except: pass
     
     if skipped_invite > 0:
         print(f'  (Skipped {skipped_invite} invite-only)')
         
+    _save_batch(normalizer.normalize_batch(raws, 'Devpost'))
     print(f'  ✓ {saved}')
     return saved
 
 def scrape_devfolio():
     print('\n🎯 Devfolio (API-Enhanced)...')
     saved = 0
+    raws = []
     try:
         # 1. Collect all events first via search API
         all_events = []
         all_events = []
         for list_type in ['application_open', 'all']:
-            # Fetch multiple pages
-            for offset in range(0, 1000, 50): # Up to 1000 events per type
+            def fetch_page(offset):
                 try:
-                    r = requests.post('https://api.devfolio.co/api/search/hackathons', 
+                    r = SESSION.post('https://api.devfolio.co/api/search/hackathons', 
                                      json={"type": list_type, "from": offset, "size": 50}, 
-                                     headers=headers, timeout=30)
-                    hits = r.json().get('hits', {}).get('hits', [])
-                    if not hits: break
-                    all_events.extend(hits)
-                    if len(hits) < 50: break # End of results
-                except: break
+                                     timeout=30)
+                    return json_loads(r.content).get('hits', {}).get('hits', [])
+                except (requests.RequestException, ValueError): return None
+            
+            # Past the last page the search API returns no hits, which ends the walk
+            all_events.extend(fetch_pages(fetch_page, range(0, 1000, 50)))  # Up to 1000 events per type
         
-        # Deduplicate by slug
-        unique_events = {}
+        # Deduplicate by slug (first hit wins; 'application_open' is a subset of 'all')
+        seen = set()
+        total_events = []
         for h in all_events:
             src = h.get('_source', {})
             slug = src.get('slug')
-            if slug: unique_events[slug] = src
-        
-        total_events = list(unique_events.values())
+            if slug and slug not in seen:
+                seen.add(slug)
+                total_events.append(src)
         print(f'  Found {len(total_events)} events. Fetching details via API...')
         
-        # 2. Fetch details via API for each hackathon
+        # 2. Fetch details via API in parallel
+        to_fetch = [{'id': src['slug'], 'url_or_id': src['slug']} for src in total_events]
+        details_map = fetch_details_parallel(to_fetch, fetch_devfolio_details_api)
+        
         for i, src in enumerate(total_events):
             try:
                 slug = src.get('slug')
                 if not slug:
                     continue
                 
-                # Fetch detailed data via API
-                details = fetch_devfolio_details_api(slug)
+                details = details_map.get(slug)
                 
                 if details:
                     # Use API data (priority)
@@ -578,7 +1037,7 @@ def scrape_devfolio():
                     'themes': themes
                 }
                 if raw['title'] and raw['url']:
-                    db.save_event(normalizer.normalize(raw, 'Devfolio'))
+                    raws.append(raw)
                     saved += 1
                     
                 # Progress indicator
@@ -590,6 +1049,7 @@ def scrape_devfolio():
                 
     except Exception as e:
         print(f'  Error: {e}')
+    _save_batch(normalizer.normalize_batch(raws, 'Devfolio'))
     print(f'  ✓ {saved}')
     return saved
 
@@ -598,63 +1058,64 @@ def scrape_devfolio():
 
 
 def scrape_hackculture():
-    print('\n🏛️ HackCulture (Browser)...')
+    print('\n🏛️ HackCulture...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
+        # Only challenge links are needed, so stream them out of the parser
+        # instead of building a tree
+        is_challenge = lambda h: '/challenges/' in h and len(h) > 15
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            # Visit /challenges directly
-            page.goto('https://hackculture.io/challenges', wait_until='networkidle', timeout=60000)
-            
-            # Scroll to trigger lazy loading
-            for _ in range(3):
-                page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                page.wait_for_timeout(1000)
-            
-            html = page.content()
-            browser.close()
-
-        soup = BeautifulSoup(html, 'html.parser')
+        # The server-rendered page usually already carries the challenge cards;
+        # only start a browser when it doesn't
+        links = []
+        r = safe_get('https://hackculture.io/challenges')
+        if r is not None and r.status_code == 200:
+            links = _collect_links(r.text, is_challenge)
         
-        # Extract events from rendered HTML
-        seen = set()
-        for a in soup.find_all('a', href=True):
-            href = a['href']
-            # Look for challenge links
-            if '/challenges/' in href and len(href) > 15:
-                if href in seen: continue
-                seen.add(href)
+        if not links:
+            with _browser_page() as page:
+                # Visit /challenges directly
+                _goto_listing(page, 'https://hackculture.io/challenges', 'a[href*="/challenges/"]')
                 
-                # Ensure full URL
-                if not href.startswith('http'): 
-                    href = urljoin('https://hackculture.io', href)
+                # Scroll to trigger lazy loading; wait for new cards rather than
+                # a fixed delay, and stop once a scroll brings in nothing
+                count_js = "() => document.querySelectorAll('a[href*=\"/challenges/\"]').length"
+                for _ in range(3):
+                    prev = page.evaluate(count_js)
+                    page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                    try:
+                        page.wait_for_function(
+                            "n => document.querySelectorAll('a[href*=\"/challenges/\"]').length > n",
+                            arg=prev, timeout=3000
+                        )
+                    except Exception:
+                        break  # Nothing more loaded
                 
-                # Extract title from card text or alt text
-                title = a.get_text(strip=True)
-                if not title:
-                    title = a.find('h3').get_text(strip=True) if a.find('h3') else a.get_text(strip=True)
+                html = page.content()
+            links = _collect_links(html, is_challenge)
+
+        # Extract events from the challenge links
+        seen = set()
+        for href, strings in links:
+            if not _is_new_link(seen, href): continue
+            
+            # Ensure full URL
+            if not href.startswith('http'): 
+                href = urljoin('https://hackculture.io', href)
+            
+            # Extract title from card text
+            title = ''.join(strings)
             
             # Extract Text for parsing
-            text = a.get_text(separator=' ', strip=True)
+            text = ' '.join(strings)
             
-            # Extract Date (e.g. "Oct 1 - Oct 5") - HackQuest dates are often range without year on card
-            # We will try to parse assuming current/next year context in normalizer if needed, or just leave as text if logic allows
-            start_date = None
-            # Regex for "Mon DD"
-            date_match = re.search(r'([A-Za-z]{3}\s+\d{1,2})', text)
-            if date_match:
-                 # Minimal effort date parsing, often insufficient without year, but better than nothing?
-                 # Actually, let's leave start_date None if no year, to avoid bad data.
-                 # Unless we assume 2025?
-                 pass
+            # Dates on cards are "Mon DD" ranges without a year, so start_date is
+            # left empty rather than guessing one
 
             # Extract Prize
             prize = "Prize TBD"
-            prize_match = re.search(r'[₹$]\s?[\d,]+', text)
+            prize_match = _RE_CARD_PRIZE.search(text)
             if prize_match: prize = prize_match.group(0)
 
             if len(title) > 3:
@@ -667,9 +1128,10 @@ def scrape_hackculture():
                     'participants_count': None,
                     'team_size_max': None
                 }
-                db.save_event(normalizer.normalize(raw, 'HackCulture')); saved += 1
+                records.append(normalizer.normalize(raw, 'HackCulture')); saved += 1
                     
     except Exception as e: print(f'  Error: {e}')
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
@@ -678,17 +1140,18 @@ def scrape_hackculture():
 def scrape_unstop():
     print('\n🎪 Unstop...')
     saved = 0
+    raws = []
     try:
         # 1. Collect all events first
         all_events = []
-        for page in range(1, 30):  # Increased limit to ~3000 events
+        def fetch_page(page):
             try:
-                r = requests.get(f'https://unstop.com/api/public/opportunity/search-result?opportunity=hackathons&per_page=100&page={page}',
-                                headers=headers, timeout=30)
-                data = r.json().get('data', {}).get('data', [])
-                if not data: break
-                all_events.extend(data)
-            except: pass
+                r = SESSION.get(f'https://unstop.com/api/public/opportunity/search-result?opportunity=hackathons&per_page=100&page={page}',
+                                timeout=30)
+                return json_loads(r.content).get('data', {}).get('data', [])
+            except (requests.RequestException, ValueError): return None
+        
+        all_events.extend(fetch_pages(fetch_page, range(1, 30)))  # Up to ~3000 events
         
         print(f'  Found {len(all_events)} events. Fetching details in parallel...')
         
@@ -701,7 +1164,7 @@ def scrape_unstop():
                 to_fetch.append({'id': str(eid), 'url_or_id': eid})
         
         # 3. Fetch details
-        details_map = fetch_details_parallel(to_fetch, fetch_unstop_details_api, max_workers=20)
+        details_map = fetch_details_parallel(to_fetch, fetch_unstop_details_api)
         
         # 4. Save events with details
         for h in all_events:
@@ -737,11 +1200,16 @@ def scrape_unstop():
                     total_cash = 0
                     currency = "₹"
                     for p in prizes_list:
-                        try:
-                            total_cash += int(float(str(p.get('cash', 0))))
-                            if p.get('currency') == 'fa-rupee': currency = "₹"
-                            elif p.get('currency') == 'fa-dollar': currency = "$"
-                        except: pass
+                        cash = p.get('cash', 0)
+                        if isinstance(cash, (int, float)):
+                            total_cash += int(cash)
+                        else:
+                            # String amounts ("5000", "5000.0"); skip anything unparseable
+                            try: total_cash += int(float(cash))
+                            except (TypeError, ValueError): continue
+                        cur = p.get('currency')
+                        if cur == 'fa-rupee': currency = "₹"
+                        elif cur == 'fa-dollar': currency = "$"
                     if total_cash > 0:
                         prize = f"{currency}{total_cash:,}"
                 
@@ -806,11 +1274,12 @@ def scrape_unstop():
                     'tags': tags,
                     'themes': themes
                 }
-                db.save_event(normalizer.normalize(raw, 'Unstop')); saved += 1
+                raws.append(raw); saved += 1
             except Exception as e: 
                 # print(f"Unstop Error: {e}") 
                 pass
     except: pass
+    _save_batch(normalizer.normalize_batch(raws, 'Unstop'))
     print(f'  ✓ {saved}')
     return saved
 
@@ -818,9 +1287,8 @@ def scrape_unstop():
 def scrape_mlh():
     print('\n🏆 MLH...')
     saved = 0
+    records = []
     try:
-        from bs4 import BeautifulSoup
-        import concurrent.futures
         
         events_to_process = []
         
@@ -829,9 +1297,9 @@ def scrape_mlh():
             r = safe_get(f'https://mlh.io/seasons/{year}/events')
             if not r: continue
             
-            soup = BeautifulSoup(r.text, 'html.parser')
-            for link in soup.find_all('a', href=True):
-                href = link['href']
+            tree = _lx_parse_response(r)
+            for link in _XP_LINKS(tree):
+                href = link.get('href')
                 
                 # Filter: Allow external links OR useful MLH subdomains
                 # Exclude simple nav links like /, /login, /about, /seasons
@@ -841,21 +1309,21 @@ def scrape_mlh():
                     if href.startswith('/'): href = f'https://mlh.io{href}'
                 
                 # Validation: Link must have some text content
-                text_blob = link.get_text(" | ", strip=True) 
+                text_blob = _lx_text(link, " | ")
                 if len(text_blob) < 5: continue
                 
                 # Heuristics extraction
                 # Title: Try H3, else first chunk
                 title = "Unknown MLH Event"
-                h3 = link.find('h3')
-                if h3:
-                    title = h3.get_text(strip=True)
+                h3 = link.find('.//h3')
+                if h3 is not None:
+                    title = _lx_text(h3)
                 else:
-                    title = text_blob.split('|')[0].strip()
+                    title = text_blob.partition('|')[0].strip()
                     
                 # Date Regex (Robust)
                 # Matches: "May 5", "May 5th", "May 5 - 7", "May 5 - May 7"
-                date_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*[-–]\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?(\d{1,2}))?', text_blob, re.IGNORECASE)
+                date_match = _RE_MLH_DATE.search(text_blob)
                 
                 start_date = None
                 end_date = None
@@ -865,18 +1333,13 @@ def scrape_mlh():
                         day = date_match.group(2)
                         year_val = year
                         # Construct ISO date (simple logic)
-                        from datetime import datetime
                         # Handle "Dec" events in "2025" season usually appearing in late 2024? 
                         # Assume season year for now.
-                        d_str = f"{month} {day} {year_val}"
-                         # Parse
-                        dt = datetime.strptime(d_str, '%b %d %Y')
-                        start_date = dt.strftime('%Y-%m-%d')
+                        start_date = _iso(month, day, year_val)
                         # End date
                         if date_match.group(3):
                              end_day = date_match.group(3)
-                             dt_end = dt.replace(day=int(end_day)) # simplistic (ignoring month rollover)
-                             end_date = dt_end.strftime('%Y-%m-%d')
+                             end_date = _iso(month, end_day, year_val) # simplistic (ignoring month rollover)
                         else:
                              end_date = start_date
                     except: pass
@@ -885,7 +1348,7 @@ def scrape_mlh():
                 location = "Online" if ('virtual' in text_blob.lower() or 'online' in text_blob.lower()) else "TBA"
                 if location == "TBA":
                     # Try to find "City, State"
-                    loc_match = re.search(r'([A-Z][a-zA-Z\s\.]+,\s*[A-Z][a-zA-Z\s\.]+)', text_blob)
+                    loc_match = _RE_MLH_LOCATION.search(text_blob)
                     if loc_match:
                          location = loc_match.group(1).strip()
                     
@@ -915,38 +1378,32 @@ def scrape_mlh():
                     return scrape_devpost_details(url)
                 # Devfolio
                 elif 'devfolio.co' in url:
-                    slug = None
-                    if 'devfolio.co/' in url:
-                         slug = url.split('devfolio.co/')[1].split('/')[0]
-                    else:
-                         slug = url.split('//')[1].split('.')[0]
+                    slug = _devfolio_slug(url)
                     if slug: 
                         return fetch_devfolio_details_api(slug)
                 # Generic / Custom Site
                 else:
                     # Visit page to get meta tags or better title/date
                     sub_r = safe_get(url)
-                    if sub_r:
-                        sub_soup = BeautifulSoup(sub_r.text, 'html.parser')
+                    if sub_r and sub_r.content:
+                        sub_tree = _lx_parse_response(sub_r)
                         # Extract meta description
-                        meta_desc = ""
-                        og_desc = sub_soup.select_one('meta[property="og:description"]')
-                        if og_desc: meta_desc = og_desc.get('content')
+                        og_desc = _XP_OG_DESCRIPTION(sub_tree)
+                        meta_desc = og_desc[0] if og_desc else ""
                         
-                        # JSON-LD?
-                        json_data = _extract_jsonld_events(sub_soup, url) # Helper exists in file? Or _extract_events_from_structure? 
-                        # _extract_jsonld_events checks for list of events, we assume single?
                         # Let's inspect title
-                        page_title = sub_soup.title.string if sub_soup.title else ""
+                        page_title = _XP_TITLE(sub_tree)
+                        page_title = page_title[0] if page_title else ""
                         
                         return {'description': meta_desc, 'page_title': page_title}
             except: pass
             return None
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        # Enrichment targets are spread over many hosts; same cap as the detail pools
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
             future_to_event = {executor.submit(fetch_enrichment, e): e for e in unique_events}
             
-            for future in concurrent.futures.as_completed(future_to_event):
+            for future in as_completed(future_to_event):
                 e = future_to_event[future]
                 result = future.result()
                 
@@ -956,36 +1413,38 @@ def scrape_mlh():
                     
                     # If we got a generic page title and original title was "Unknown", update it
                     if e['title'] == "Unknown MLH Event" and result.get('page_title'):
-                         e['title'] = result.get('page_title').split('|')[0].strip()
+                         e['title'] = result.get('page_title').partition('|')[0].strip()
                     
                     # Fix devpost participants mapping
                     if 'participants' in result and not 'participants_count' in e:
                          e['participants_count'] = result['participants']
 
                 # Save
-                db.save_event(normalizer.normalize(e, 'MLH'))
+                records.append(normalizer.normalize(e, 'MLH'))
                 saved += 1
                 
     except Exception as e: 
         print(f"  MLH Error: {e}")
-        import traceback
         traceback.print_exc()
         
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
 def scrape_superteam():
     print('\n☀️ Superteam...')
     saved = 0
+    records = []
     try:
         r = safe_get('https://earn.superteam.fun/api/listings/?type=hackathon')
         if r:
-            for h in r.json()[:50]:
+            for h in json_loads(r.content)[:50]:
                 raw = {'title': h.get('title'), 'url': h.get('link'), 'prize': h.get('rewardAmount'), 'mode': 'online',
                        'participants_count': h.get('_count', {}).get('Submission') if isinstance(h.get('_count'), dict) else None,
                        'team_size_max': h.get('team_size')}
-                db.save_event(normalizer.normalize(raw, 'Superteam')); saved += 1
+                records.append(normalizer.normalize(raw, 'Superteam')); saved += 1
     except: pass
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
@@ -1001,34 +1460,29 @@ def scrape_superteam():
 def scrape_dorahacks():
     print('\n🐶 DoraHacks (Browser - Anti-Bot)...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
-        import random
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            # Use stealthy context options
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                viewport={'width': 1366, 'height': 768},
-                device_scale_factor=1,
-            )
-            page = context.new_page()
+        # Use stealthy context options
+        with _browser_page(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={'width': 1366, 'height': 768},
+            device_scale_factor=1,
+        ) as page:
             
             # Go to home first
             try:
-                page.goto('https://dorahacks.io/', wait_until='domcontentloaded', timeout=30000)
+                page.goto('https://dorahacks.io/', wait_until='domcontentloaded', timeout=25000)
                 page.wait_for_timeout(2000 + random.randint(100, 1000))
                 
                 # Look for "Hackathon" link
                 # Typically in nav
                 page.click('a[href="/hackathon"]')
-                page.wait_for_load_state('networkidle', timeout=30000)
+                page.wait_for_load_state('domcontentloaded', timeout=25000)
                 
             except:
                 # Fallback to direct navigation if click fails
-                page.goto('https://dorahacks.io/hackathon', wait_until='domcontentloaded', timeout=40000)
+                page.goto('https://dorahacks.io/hackathon', wait_until='domcontentloaded', timeout=25000)
 
             # Wait for content
             try: page.wait_for_selector('.hackathon-list, a[href*="/hackathon/"]', timeout=20000)
@@ -1040,30 +1494,28 @@ def scrape_dorahacks():
                 page.wait_for_timeout(1000)
                 
             html = page.content()
-            browser.close()
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = lxml_html.fromstring(html)
         seen = set()
         
         # Selectors might be generic or specific classes
         # DoraHacks cards are usually <a> links
-        for card in soup.select('a[href*="/hackathon/"]'):
+        for card in _XP_DORAHACKS_CARDS(tree):
             href = card.get('href', '')
             if not href.startswith('http'): href = 'https://dorahacks.io' + href
             
-            if href in seen: continue
-            seen.add(href)
+            if not _is_new_link(seen, href): continue
             
             # Extract title
-            title_el = card.select_one('.font-semibold, h3, h4')
-            if not title_el: title_el = card.find('div', class_=lambda c: c and 'title' in c.lower())
+            title_el = _lx_first(card, _XP_DORAHACKS_TITLE)
+            if title_el is None: title_el = _lx_first(card, _XP_DORAHACKS_TITLE_DIV)
             
-            title = title_el.get_text(strip=True) if title_el else ""
+            title = _lx_text(title_el) if title_el is not None else ""
             if len(title) > 3:
                 # Extract participants count from card text
-                text = card.get_text(separator=' ', strip=True)
+                text = _lx_text(card, ' ')
                 participants = None
-                p_match = re.search(r'(\d+)\s+Participants?', text, re.IGNORECASE)
+                p_match = _RE_PARTICIPANTS.search(text)
                 if p_match:
                     participants = int(p_match.group(1))
                 
@@ -1075,9 +1527,10 @@ def scrape_dorahacks():
                     'participants_count': participants,
                     'team_size_max': None
                 }
-                db.save_event(normalizer.normalize(raw, 'DoraHacks')); saved += 1
+                records.append(normalizer.normalize(raw, 'DoraHacks')); saved += 1
                 
     except Exception as e: print(f'  Error: {e}')
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
@@ -1090,15 +1543,12 @@ def scrape_dorahacks():
 def scrape_techgig():
     print('\n💻 TechGig (Browser - Broad)...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        with _browser_page() as page:
             # Try engage subdomain directly as it seemed to have links in debug
-            page.goto('https://engage.techgig.com/hackathons', wait_until='networkidle', timeout=60000)
+            _goto_listing(page, 'https://engage.techgig.com/hackathons', 'a[href*="/hackathon"], a[href*="/challenge"]')
             
             # Scroll
             for _ in range(3):
@@ -1106,27 +1556,19 @@ def scrape_techgig():
                 page.wait_for_timeout(1000)
                 
             html = page.content()
-            browser.close()
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = lxml_html.fromstring(html)
         seen = set()
         
         # Broadest possible search: All links with 'hackathon' or 'challenge'
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        for link in _XP_TECHGIG_LINKS(tree):
+            href = link.get('href')
             
             # Strict-ish filtering to avoid garbage
             if 'void(0)' in href or len(href) < 10: continue
             if 'contact-us' in href or 'about-us' in href or 'login' in href: continue
-             
-            # accepted patterns
-            is_valid = False
-            if '/hackathon' in href or '/challenge' in href: is_valid = True
-            
-            if not is_valid: continue
             
-            if href in seen: continue
-            seen.add(href)
+            if not _is_new_link(seen, href): continue
             
             if not href.startswith('http'): 
                 if href.startswith('/'):
@@ -1134,16 +1576,18 @@ def scrape_techgig():
                 else:
                     href = 'https://engage.techgig.com/' + href
             
+            # Enclosing card, shared by title and text extraction
+            card = next(link.iterancestors('div'), None)
+            
             # Title extraction - try link text first
-            title = link.get_text(strip=True)
+            title = _lx_text(link)
             
             # If link text is empty/generic (e.g. "View"), try finding a title sibling/parent
             if not title or len(title) < 5 or title.lower() in ['view', 'participate', 'register']:
                 # Inspect parent
-                card = link.find_parent('div') 
-                if card:
-                    h_tag = card.find(['h2', 'h3', 'h4', 'h5'])
-                    if h_tag: title = h_tag.get_text(strip=True)
+                if card is not None:
+                    h_tag = _lx_first(card, _XP_HEADINGS)
+                    if h_tag is not None: title = _lx_text(h_tag)
 
             if not title: continue # Skip if no title found
             
@@ -1155,27 +1599,22 @@ def scrape_techgig():
                 participants = None
                 text = ""
                 # Check parent card text
-                card = link.find_parent('div')
-                if card:
-                    text = card.get_text(separator=' ', strip=True)
-                    p_match = re.search(r'(\d+)\s+Registered', text, re.IGNORECASE)
-                    if p_match: participants = int(p_match.group(1))
+                if card is not None:
+                    text = _lx_text(card, ' ')[:_CARD_TEXT_LIMIT]
+                fields = _scan_card_text(text, _RE_TECHGIG_CARD)
+                if 'parts' in fields: participants = int(fields['parts'])
 
                 # Extract dates
                 start_date = None
                 # Debug logging
-                if saved < 2: print(f"  [TechGig Debug] Text: {text[:100]}...")
-                date_match = re.search(r'([A-Za-z]{3}\s+\d{1,2},\s+\d{4})', text)
-                if date_match:
+                if DEBUG and saved < 2: print(f"  [TechGig Debug] Text: {text[:100]}...")
+                if 'date' in fields:
                     try: 
-                        from datetime import datetime
-                        start_date = datetime.strptime(date_match.group(1), '%b %d, %Y').strftime('%Y-%m-%d')
+                        start_date = datetime.strptime(fields['date'], '%b %d, %Y').strftime('%Y-%m-%d')
                     except: pass
                 
                 # Extract prize
-                prize = "Prize TBD"
-                prize_match = re.search(r'[₹$]\s?[\d,]+', text)
-                if prize_match: prize = prize_match.group(0)
+                prize = fields.get('prize', "Prize TBD")
 
                 raw = {
                     'title': title,
@@ -1186,9 +1625,10 @@ def scrape_techgig():
                     'participants_count': participants, 
                     'team_size_max': None
                 }
-                db.save_event(normalizer.normalize(raw, 'TechGig')); saved += 1
+                records.append(normalizer.normalize(raw, 'TechGig')); saved += 1
                 
     except Exception as e: print(f'  Error: {e}')
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
@@ -1200,22 +1640,18 @@ def scrape_techgig():
 def scrape_geeksforgeeks():
     print('\n📗 GeeksforGeeks (Browser)...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from datetime import datetime
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto('https://www.geeksforgeeks.org/events/', wait_until='networkidle', timeout=30000)
+        with _browser_page() as page:
+            _goto_listing(page, 'https://www.geeksforgeeks.org/events/', 'a[href^="/event/"]')
             page.wait_for_timeout(3000)
             
             cards = page.query_selector_all('a[href^="/event/"]')
             seen = set()
             for card in cards:
                 href = card.get_attribute('href')
-                if not href or href in seen: continue
-                seen.add(href)
+                if not href or not _is_new_link(seen, href): continue
                 if not href.startswith('http'): href = 'https://www.geeksforgeeks.org' + href
                 
                 # Extract text for parsing
@@ -1224,28 +1660,24 @@ def scrape_geeksforgeeks():
                 
                 title = ""
                 start_date = None
+                fields = {}
                 
                 if lines:
                     title = max(lines, key=len)
                     
-                    for line in lines:
-                        if line == title: continue
-                        clean_line = line.replace('|', '').strip()
-                        # Try parsing "February 24, 2025" format
-                        try:
-                            # Try standard full date
-                            dt = datetime.strptime(clean_line, '%B %d, %Y')
-                            start_date = dt.strftime('%Y-%m-%d')
-                            break
-                        except: pass
+                    # Find a "February 24, 2025" date and the prize outside the title line
+                    rest = '\n'.join(line for line in lines if line != title)
+                    fields = _scan_card_text(rest, _RE_GFG_CARD)
+                    if 'date' in fields:
+                        mon, day, year = fields['date'].replace(',', '').split()
+                        try: start_date = _iso(mon, day, year)
+                        except (KeyError, ValueError): pass
                 
-                # Extract Prize
-                prize = "Prize TBD"
-                for line in lines:
-                    if '₹' in line or '$' in line:
-                        import re
-                        pm = re.search(r'[₹$]\s?[\d,]+', line)
-                        if pm: prize = pm.group(0); break
+                # Extract Prize (the title line only as a fallback)
+                prize = fields.get('prize')
+                if not prize:
+                    prize_match = _RE_CARD_PRIZE.search(title)
+                    prize = prize_match.group(0) if prize_match else "Prize TBD"
 
                 if title:
                     raw = {
@@ -1257,9 +1689,9 @@ def scrape_geeksforgeeks():
                         'participants_count': None,
                         'team_size_max': None
                     }
-                    db.save_event(normalizer.normalize(raw, 'GeeksforGeeks')); saved += 1
-            browser.close()
+                    records.append(normalizer.normalize(raw, 'GeeksforGeeks')); saved += 1
     except Exception as e: print(f'  Error: {e}')
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
@@ -1267,22 +1699,32 @@ def scrape_geeksforgeeks():
 
 
 
+def _hackerearth_card_map(soup):
+    """
+    id(link) -> its challenge card: the nearest .challenge-card-modern
+    ancestor, else the nearest .challenge-card. Built in one downward pass
+    per class; document order visits outer cards first, so inner ones win.
+    """
+    modern_of, card_of = {}, {}
+    for cls, mapping in (('challenge-card-modern', modern_of), ('challenge-card', card_of)):
+        for c in soup.find_all(class_=cls):
+            for a in c.find_all('a'):
+                mapping[id(a)] = c
+    card_of.update(modern_of)  # A modern card wins over any plain one
+    return card_of
+
 def scrape_hackerearth():
     print('\n🧠 HackerEarth (Browser)...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            # Use stealthy context options (restored)
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                viewport={'width': 1366, 'height': 768}
-            )
-            page = context.new_page()
-            page.goto('https://www.hackerearth.com/challenges/', wait_until='networkidle', timeout=60000)
+        # Use stealthy context options (restored)
+        with _browser_page(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={'width': 1366, 'height': 768}
+        ) as page:
+            _goto_listing(page, 'https://www.hackerearth.com/challenges/', 'a[href*="/challenges/"]')
             
             # Scroll to load more
             for _ in range(5):
@@ -1290,15 +1732,16 @@ def scrape_hackerearth():
                 page.wait_for_timeout(1000)
                 
             html = page.content()
-            browser.close()
 
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         seen = set()
         
         # Select challenge cards
         # Typically they have class 'challenge-card-modern' or similar
         # We'll use a broad selector for links to event pages
+        card_text = {}  # id(card element) -> text
+        card_of = _hackerearth_card_map(soup)
         for card in soup.select('a[href*="/challenges/"], .challenge-card-modern a'):
             href = card.get('href', '')
             if not href: continue
@@ -1310,18 +1753,20 @@ def scrape_hackerearth():
             if '/hackathon/' not in href and '/challenge/' not in href: continue
             if 'hackerearth.com/challenges/' in href and len(href) < 45: continue # likely just the list page
             
-            if href in seen: continue
-            seen.add(href)
+            if not _is_new_link(seen, href): continue
+            
+            # Enclosing challenge card, shared by title and text extraction
+            parent = card_of.get(id(card))
             
             # Extract title
             title = ""
             # Try to find title in common containers within the link or parent
             # If the link itself is the title
-            if len(card.get_text(strip=True)) > 5:
-                title = card.get_text(strip=True)
+            link_text = card.get_text(strip=True)
+            if len(link_text) > 5:
+                title = link_text
             else:
                 # Look in parent
-                parent = card.find_parent(class_='challenge-card-modern')
                 if parent:
                     t_el = parent.select_one('.challenge-list-title')
                     if t_el: title = t_el.get_text(strip=True)
@@ -1333,27 +1778,27 @@ def scrape_hackerearth():
 
             # Extract participants
             participants = None
-            parent = card.find_parent(class_='challenge-card-modern') or card.find_parent(class_='challenge-card')
             if parent:
-                # Extract Text for parsing
-                text = parent.get_text(separator=' ', strip=True)
-                if saved < 2: print(f"  [HE Debug] Text: {text[:100]}...")
-                # pattern: "2000 Registered" or "2000+ Registered"
-                p_match = re.search(r'([\d,]+)\+?\s+Registered', text, re.IGNORECASE)
-                if p_match:
-                    p_str = p_match.group(1).replace(',', '')
-                    participants = int(p_str)
+                # Extract Text for parsing; several links can share one card
+                pid = id(parent)
+                text = card_text.get(pid)
+                if text is None:
+                    text = card_text[pid] = parent.get_text(separator=' ', strip=True)[:_CARD_TEXT_LIMIT]
+                if DEBUG and saved < 2: print(f"  [HE Debug] Text: {text[:100]}...")
             else:
                 text = "" # Ensure text is defined even if no parent card is found
+            fields = _scan_card_text(text, _RE_HACKEREARTH_CARD)
+            # pattern: "2000 Registered" or "2000+ Registered"
+            p_str = fields.get('parts', '').replace(',', '')
+            if p_str:
+                participants = int(p_str)
 
             if len(title) > 3:
                 # Extract dates
                 start_date = None
-                date_match = re.search(r'(?:Starts on|STARTS ON)\s*:?\s*([A-Za-z]{3}\s+\d{1,2},\s+\d{2,4})', text, re.IGNORECASE)
-                if date_match:
+                if 'date' in fields:
                     try:
-                        from datetime import datetime
-                        dt_str = date_match.group(1)
+                        dt_str = fields['date']
                         # Handle 2-digit year
                         if ',' in dt_str and len(dt_str.split(',')[-1].strip()) == 2:
                              dt_str = dt_str.rsplit(' ', 1)[0] + ' 20' + dt_str.split(',')[-1].strip()
@@ -1361,9 +1806,7 @@ def scrape_hackerearth():
                     except: pass
 
                 # Extract prize
-                prize = "Prize TBD"
-                prize_match = re.search(r'[₹$]\s?[\d,]+', text)
-                if prize_match: prize = prize_match.group(0)
+                prize = fields.get('prize', "Prize TBD")
 
                 raw = {
                     'title': title, 
@@ -1374,9 +1817,10 @@ def scrape_hackerearth():
                     'participants_count': participants,
                     'team_size_max': None
                 }
-                db.save_event(normalizer.normalize(raw, 'HackerEarth')); saved += 1
+                records.append(normalizer.normalize(raw, 'HackerEarth')); saved += 1
                 
     except Exception as e: print(f'  Error: {e}')
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
@@ -1384,48 +1828,41 @@ def scrape_hackerearth():
 def scrape_hackquest():
     print('\n🎮 HackQuest (Browser)...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto('https://www.hackquest.io/hackathons', wait_until='networkidle', timeout=60000)
+        with _browser_page() as page:
+            _goto_listing(page, 'https://www.hackquest.io/hackathons', 'a[href^="/hackathons/"]')
             for _ in range(3): page.evaluate('window.scrollTo(0, document.body.scrollHeight)'); page.wait_for_timeout(1000)
-            html = page.content()
-            browser.close()
+            cards = page.eval_on_selector_all('a[href^="/hackathons/"]', _JS_HACKQUEST_CARDS)
             
-        soup = BeautifulSoup(html, 'html.parser')
         seen = set()
-        for card in soup.select('a[href^="/hackathons/"]'):
-            href = card.get('href', '')
-            if not href or href in seen: continue
-            seen.add(href)
+        for card in cards:
+            href = card['href']
+            if not href or not _is_new_link(seen, href): continue
             if not href.startswith('http'): href = 'https://www.hackquest.io' + href
             
-            title = ""
-            h2 = card.find('h2')
-            if h2: title = h2.get_text(strip=True)
+            title = card['title']
             if title:
                 raw = {'title': title, 'url': href, 'mode': 'online',
                        'participants_count': None, 'team_size_max': None}
-                db.save_event(normalizer.normalize(raw, 'HackQuest')); saved += 1
+                records.append(normalizer.normalize(raw, 'HackQuest')); saved += 1
     except Exception as e: print(f'  Error: {e}')
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
+@_memoize_details
 def fetch_devfolio_details_api(slug):
     """Fetch hackathon details from Devfolio REST API (fast ~0.5s)."""
     try:
-        r = requests.get(
+        r = SESSION.get(
             f'https://api.devfolio.co/api/hackathons/{slug}',
-            headers={'Accept': 'application/json'},
             timeout=10
         )
         if r.status_code != 200:
             return None
         
-        data = r.json()
+        data = json_loads(r.content)
         hs = data.get('hackathon_setting', {})
         
         # Registration end date (priority) - from Schedule tab
@@ -1443,13 +1880,12 @@ def fetch_devfolio_details_api(slug):
         # Get prizes from separate endpoint
         prize = 'Prize TBD'
         try:
-            pr = requests.get(
+            pr = SESSION.get(
                 f'https://api.devfolio.co/api/hackathons/{slug}/prizes',
-                headers={'Accept': 'application/json'},
                 timeout=10
             )
             if pr.status_code == 200:
-                prizes = pr.json()
+                prizes = json_loads(pr.content)
                 if prizes:
                     total = sum(float(p.get('amount', 0)) for p in prizes)
                     if total > 0:
@@ -1478,16 +1914,13 @@ def scrape_devdisplay():
     """Scrape DevDisplay hackathons with fast API-based detail fetching."""
     print('\n🖥️ DevDisplay (API-Enhanced)...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
         
         # Step 1: Get listing page (browser required - JS-rendered page)
         print('  Fetching listing page via browser...')
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto('https://www.devdisplay.org/hackathons', wait_until='networkidle', timeout=60000)
+        with _browser_page() as page:
+            _goto_listing(page, 'https://www.devdisplay.org/hackathons', 'a:has-text("Apply Now")')
             
             # Scroll to trigger any lazy loading
             for _ in range(5):
@@ -1495,44 +1928,34 @@ def scrape_devdisplay():
                 page.wait_for_timeout(1000)
                 
             page.wait_for_timeout(2000)
-            html = page.content()
-            browser.close()
+            cards = page.eval_on_selector_all('a', _JS_DEVDISPLAY_CARDS)
         
-        soup = BeautifulSoup(html, 'html.parser')
         hackathons_to_scrape = []
         seen = set()
         
         # Extract hackathon cards
-        for link in soup.find_all('a'):
-            if 'apply now' not in link.get_text(strip=True).lower():
+        for card in cards:
+            href = card['href']
+            if not href or not _is_new_link(seen, href):
                 continue
-            href = link.get('href')
-            if not href or href in seen:
-                continue
-            seen.add(href)
-            
-            card = link.find_parent('div')
-            if card:
-                card = card.find_parent('div')
-            if not card:
+            if not card['found']:
                 continue
             
             # Extract title
-            title_el = card.find('h2')
-            title = title_el.get_text(strip=True) if title_el else ''
+            title = card['title']
             if not title:
-                title = (card.get('id') or '').replace('-', ' ').title()
+                title = card['id'].replace('-', ' ').title()
             
             # Extract date from card text (format: "Sep 20 - 21")
-            card_text = card.get_text(separator=' ', strip=True)
-            date_match = re.search(r'([A-Z][a-z]{2})\s+(\d{1,2})\s*[-–]\s*(\d{1,2})', card_text)
+            card_text = card['text']
+            card_lower = card_text.lower()
+            date_match = _RE_DEVDISPLAY_DATE.search(card_text)
             start_date = None
             end_date = None
             if date_match:
                 month = date_match.group(1)
                 day_start = date_match.group(2)
                 day_end = date_match.group(3)
-                from datetime import datetime
                 year = datetime.now().year
                 try:
                     start_dt = datetime.strptime(f"{month} {day_start} {year}", "%b %d %Y")
@@ -1549,7 +1972,7 @@ def scrape_devdisplay():
             location = 'Online'
             mode = 'online'
             if 'India' in card_text or 'Bengaluru' in card_text or 'Mumbai' in card_text or 'Delhi' in card_text:
-                loc_match = re.search(r'([A-Za-z]+,?\s*India)', card_text)
+                loc_match = _RE_INDIA_LOCATION.search(card_text)
                 if loc_match:
                     location = loc_match.group(1)
                     mode = 'in-person'
@@ -1561,7 +1984,7 @@ def scrape_devdisplay():
             tags = []
             tag_patterns = ['AI/ML', 'Web3', 'Blockchain', 'Open Innovation', 'Fintech', 'Healthcare', 'EdTech']
             for tag in tag_patterns:
-                if tag.lower() in card_text.lower():
+                if tag.lower() in card_lower:
                     tags.append(tag)
             
             hackathons_to_scrape.append({
@@ -1579,27 +2002,17 @@ def scrape_devdisplay():
         # Step 2: Fetch details via fast API calls
         for i, h in enumerate(hackathons_to_scrape):
             url = h['url']
-            print(f'    [{i+1}/{len(hackathons_to_scrape)}] {h["title"][:40]}...')
+            if DEBUG: print(f'    [{i+1}/{len(hackathons_to_scrape)}] {h["title"][:40]}...')
             
             try:
                 if 'devfolio.co' in url:
                     # Extract slug from URL (handle both "slug.devfolio.co" and "devfolio.co/slug")
-                    slug = None
-                    # Try subdomain match first
-                    sub_match = re.search(r'https?://([^.]+)\.devfolio\.co', url)
-                    if sub_match and sub_match.group(1) != 'www':
-                        slug = sub_match.group(1)
-                    else:
-                        # Try path match
-                        path_match = re.search(r'devfolio\.co/([^/?]+)', url)
-                        if path_match:
-                            slug = path_match.group(1)
-                            
+                    slug = _devfolio_slug(url)
                     if slug:
                         # Enforce canonical URL to prevent duplicates (e.g. devfolio.co/slug -> slug.devfolio.co)
                         h['url'] = f"https://{slug}.devfolio.co/"
                         
-                        details = fetch_devfolio_details_api(slug)
+                        details = None if _out_of_time() else fetch_devfolio_details_api(slug)
                         if details:
                             # Merge details (API data takes priority)
                             if details.get('start_date'): h['start_date'] = details['start_date']
@@ -1613,8 +2026,8 @@ def scrape_devdisplay():
                         
                 elif 'unstop.com' in url:
                     # Extract event ID from end of URL (e.g., "...-154300")
-                    match = re.search(r'-(\d+)$', url)
-                    if match:
+                    match = _RE_UNSTOP.search(url)
+                    if match and not _out_of_time():
                         details = fetch_unstop_details_api(match.group(1))
                         if details:
                             if details.get('end_date'): h['end_date'] = parse_iso_timestamp(details['end_date'])
@@ -1649,47 +2062,43 @@ def scrape_devdisplay():
                 'tags': h.get('tags', []),
                 'description': h.get('description', '')
             }
-            db.save_event(normalizer.normalize(raw, 'DevDisplay'))
+            records.append(normalizer.normalize(raw, 'DevDisplay'))
             saved += 1
             
     except Exception as e:
         print(f'  Error: {e}')
-        import traceback
         traceback.print_exc()
     
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
 def scrape_mycareernet():
     print('\n💼 MyCareerNet (Browser)...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto('https://mycareernet.in/mycareernet/contests', wait_until='networkidle', timeout=60000)
+        with _browser_page() as page:
+            _goto_listing(page, 'https://mycareernet.in/mycareernet/contests', '.hackathonCard')
             page.wait_for_timeout(3000)
             html = page.content()
-            browser.close()
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         seen = set()
         for card in soup.select('.hackathonCard'):
             link = card.find('a', href=True)
             if not link: continue
             href = link['href']
-            if not href or href in seen: continue
-            seen.add(href)
+            if not href or not _is_new_link(seen, href): continue
             if href.startswith('/'): href = 'https://mycareernet.in' + href
             
             title = card.get_text().split('\n')[0][:100] # Simplification
             if title:
                 raw = {'title': title, 'url': href, 'mode': 'online',
                        'participants_count': None, 'team_size_max': None}
-                db.save_event(normalizer.normalize(raw, 'MyCareerNet')); saved += 1
+                records.append(normalizer.normalize(raw, 'MyCareerNet')); saved += 1
     except Exception as e: print(f'  Error: {e}')
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
@@ -1697,15 +2106,11 @@ def scrape_mycareernet():
 def scrape_kaggle():
     print('\n📊 Kaggle (Browser)...')
     saved = 0
+    records = []
     try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
-        import re
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto('https://www.kaggle.com/competitions', wait_until='networkidle', timeout=60000)
+        with _browser_page() as page:
+            _goto_listing(page, 'https://www.kaggle.com/competitions', 'a[href*="/competitions/"]')
             
             # Scroll to load more
             for _ in range(5):
@@ -1715,67 +2120,67 @@ def scrape_kaggle():
             html = page.content()
             
             # Parse listing page
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = lxml_html.fromstring(html)
             seen = set()
             competitions = []
+            container_text = {}  # container element -> (stripped length, text); sibling cards share ancestors
             
-            # Collect competition URLs and basic info
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                
-                # Filter for competition links
-                if '/competitions/' not in href and '/c/' not in href: 
-                    continue
-                if 'about' in href or 'documentation' in href: 
-                    continue
+            # Collect competition URLs and basic info (links filtered in XPath)
+            for link in _XP_KAGGLE_LINKS(tree):
+                href = link.get('href')
                     
                 # Clean href
                 if not href.startswith('http'): 
                     href = 'https://www.kaggle.com' + href
                 
-                if href in seen: 
+                if not _is_new_link(seen, href):
                     continue
-                seen.add(href)
                 
                 # Extract basic info from listing
-                container = link.parent
+                container = link.getparent()
+                text, size = '', 0
                 for _ in range(3):
-                    if not container: break
-                    if container.name in ['div', 'li'] and len(container.get_text(strip=True)) > 50:
-                        break
-                    container = container.parent
+                    if container is None: break
+                    if container.tag in ('div', 'li'):
+                        cached = container_text.get(container)
+                        if cached is None:
+                            # Threshold on get_text(strip=True) length, i.e. without separators
+                            parts = [t for t in (s.strip() for s in _XP_NODE_TEXT(container)) if t]
+                            cached = container_text[container] = (sum(map(len, parts)), ' '.join(parts))
+                        size, text = cached
+                        if size > 50:
+                            break
+                    container = container.getparent()
                 
-                if not container:
+                if container is None:
                     continue
-                    
-                text = container.get_text(separator=' ', strip=True)
-                
-                # Extract Title
-                full_text = link.get_text(separator='|', strip=True)
-                parts = [pt.strip() for pt in full_text.split('|') if pt.strip()]
-                title = parts[0] if parts else "Unknown"
+                if container.tag not in ('div', 'li') or size <= 50:
+                    text = _lx_text(container, ' ')
                 
-                if title.lower() == 'featured' and len(parts) > 1:
-                    title = parts[1]
+                # Extract Title (skip a leading "Featured" badge)
+                strings = (t for t in (s.strip() for s in link.itertext()) if t)
+                title = next(strings, "Unknown")
+                if title.lower() == 'featured':
+                    title = next(strings, title)
                 
                 if not title or len(title) < 3:
                     continue
                     
                 # Prize from listing
                 prize = "Prize TBD"
-                prize_match = re.search(r'\$[\d,]+', text)
+                prize_match = _RE_PRIZE.search(text)
                 if prize_match:
                     prize = prize_match.group(0)
                 
                 # Teams from listing
                 participants = None
-                tm_match = re.search(r'([\d,]+)\s+Teams?', text, re.IGNORECASE)
+                tm_match = _RE_TEAMS.search(text)
                 if tm_match:
                     participants = int(tm_match.group(1).replace(',', ''))
                 
                 # Days left (for sorting/priority)
                 days_left = None
-                days_match = re.search(r'(\d+)\s+days?\s+to\s+go', text, re.IGNORECASE)
+                days_match = _RE_KAGGLE_DAYS_LEFT.search(text)
                 if days_match:
                     days_left = int(days_match.group(1))
                 
@@ -1792,26 +2197,22 @@ def scrape_kaggle():
             # Fetch detail pages for dates, description, team size
             for i, comp in enumerate(competitions[:50]):  # Limit to 50 for speed
                 try:
-                    page.goto(comp['url'], wait_until='domcontentloaded', timeout=30000)
+                    if _out_of_time():
+                        raise TimeoutError('scrape budget spent')  # Save listing data only
+                    page.goto(comp['url'], wait_until='domcontentloaded', timeout=25000)
                     page.wait_for_timeout(2000)  # Wait for JS to render
                     
                     detail_html = page.content()
-                    detail_soup = BeautifulSoup(detail_html, 'html.parser')
+                    detail_soup = BeautifulSoup(detail_html, 'lxml')
                     detail_text = detail_soup.get_text(separator=' ', strip=True)
                     
                     # Extract deadline/end date
                     # Look for patterns like "Deadline: February 10, 2025" or "Feb 10, 2025"
                     end_date = None
-                    date_patterns = [
-                        r'Deadline[:\s]+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-                        r'Ends?\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-                        r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s+(?:deadline|ends?)',
-                    ]
-                    for pattern in date_patterns:
-                        date_match = re.search(pattern, detail_text, re.IGNORECASE)
+                    for pattern in _RE_KAGGLE_DEADLINES:
+                        date_match = pattern.search(detail_text)
                         if date_match:
                             try:
-                                from datetime import datetime
                                 date_str = date_match.group(1).replace(',', '')
                                 # Try parsing
                                 for fmt in ['%B %d %Y', '%b %d %Y']:
@@ -1826,12 +2227,12 @@ def scrape_kaggle():
                     
                     # Extract team size
                     team_size_max = None
-                    team_match = re.search(r'(?:team\s+size|members?)[:\s]+(?:up\s+to\s+)?(\d+)', detail_text, re.IGNORECASE)
+                    team_match = _RE_KAGGLE_TEAM.search(detail_text)
                     if team_match:
                         team_size_max = int(team_match.group(1))
                     else:
                         # Try "1-5 members" pattern
-                        team_match2 = re.search(r'(\d+)\s*[-–]\s*(\d+)\s+(?:team\s+)?members?', detail_text, re.IGNORECASE)
+                        team_match2 = _RE_KAGGLE_TEAM_RANGE.search(detail_text)
                         if team_match2:
                             team_size_max = int(team_match2.group(2))
                     
@@ -1840,7 +2241,9 @@ def scrape_kaggle():
                     paragraphs = detail_soup.find_all('p')
                     for para in paragraphs:
                         text = para.get_text(strip=True)
-                        if len(text) > 100 and 'cookie' not in text.lower() and 'privacy' not in text.lower():
+                        if len(text) <= 100: continue
+                        lowered = text.lower()
+                        if 'cookie' not in lowered and 'privacy' not in lowered:
                             description = text[:500]
                             break
                     
@@ -1857,7 +2260,7 @@ def scrape_kaggle():
                         'description': description,
                         'tags': extract_tags_from_text(description)
                     }
-                    db.save_event(normalizer.normalize(raw, 'Kaggle'))
+                    records.append(normalizer.normalize(raw, 'Kaggle'))
                     saved += 1
                     
                     if (i + 1) % 10 == 0:
@@ -1872,15 +2275,16 @@ def scrape_kaggle():
                         'prize': comp['prize'],
                         'participants_count': comp['participants']
                     }
-                    db.save_event(normalizer.normalize(raw, 'Kaggle'))
+                    records.append(normalizer.normalize(raw, 'Kaggle'))
                     saved += 1
             
-            browser.close()
                 
     except Exception as e: 
         print(f'  Error: {e}')
-        import traceback
         traceback.print_exc()
+    
+    # One transaction for everything collected, even after a partial failure
+    _save_batch(records)
     print(f'  ✓ {saved}')
     return saved
 
@@ -1898,17 +2302,36 @@ def main():
         scrape_kaggle
     ]
     
+    global _deadline
+    _deadline = time.monotonic() + SCRAPER_TIMEOUT
+    
+    # Each scraper talks to a different host, so run them all at once
     total = 0
-    for s in scrapers:
-        try: total += s()
-
-        except Exception as e: print(f"  Error running scraper: {e}")
-        time.sleep(0.5)
+    executor = ThreadPoolExecutor(max_workers=len(scrapers))
+    futures = {executor.submit(s): s.__name__ for s in scrapers}
+    try:
+        for future in as_completed(futures, timeout=SCRAPER_TIMEOUT + SCRAPER_GRACE):
+            try: total += future.result()
+            except Exception as e: print(f"  Error running {futures[future]}: {e}")
+    except FuturesTimeout:
+        pass
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    running = [name for future, name in futures.items() if not future.done()]
         
     print('\n' + '='*50)
+    if running:
+        print(f'  Abandoned after {SCRAPER_TIMEOUT + SCRAPER_GRACE}s (not counted): {", ".join(running)}')
     print(f'  Total this run: {total}')
     print(f'  Database total: {db.get_statistics()["total_events"]} hackathons')
     print('='*50)
+    
+    if running:
+        # Worker threads can't be stopped and the interpreter would join them
+        # at exit, so leave without waiting; SQLite rolls back any open write
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
 
 if __name__ == '__main__':
     main()
@@ -3,126 +3,154 @@ MEGA Scraper - 1000 each from Devfolio and Unstop
 """
 import requests
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, '.')
 
 from database.db_manager import DatabaseManager
 from utils.data_normalizer import DataNormalizer
+from utils.http_client import create_session, fetch_pages, json_loads
 
 headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0', 'Accept': 'application/json'}
 db = DatabaseManager('hackathons.db')
 normalizer = DataNormalizer()
 
+# Pages requested at once per listing type (instead of one page + a pause at a time)
+PAGE_WINDOW = 5
+
+# Keep-alive pool per API host; retries with backoff on 429/5xx replace the
+# fixed sleeps between pages
+session = create_session(headers, pool_connections=2, pool_maxsize=PAGE_WINDOW, retry_post=True)
+
+def _fetch_json(method, url, path, **kwargs):
+    """Request url and walk the JSON response down `path`; None on failure."""
+    try:
+        r = session.request(method, url, timeout=30, **kwargs)
+        if r.status_code != 200:
+            print(f'    Status {r.status_code}, stopping')
+            return None
+        data = json_loads(r.content)
+        for key in path:
+            data = data.get(key, {})
+        return data or None
+    except (requests.RequestException, ValueError, AttributeError) as e:
+        print(f'    {url} error: {e}')
+        return None
+
+def _total_count(total):
+    """Result count from a search response's total, which is either a number
+    or an Elasticsearch {'value': n, ...} object; None if missing"""
+    if isinstance(total, dict):
+        total = total.get('value')
+    return total if isinstance(total, int) else None
+
 def scrape_devfolio_mega():
     """Scrape 1000+ from Devfolio"""
     print('\n🎯 MEGA Devfolio Scrape (targeting 1000)...')
     saved = 0
+    raws = []
     
     # Devfolio has different listing types
     types = ['all', 'application_open', 'past', 'upcoming']
     
     for list_type in types:
-        print(f'\n  Type: {list_type}')
-        for offset in range(0, 300, 100):  # 300 per type = 1200 total
+        # The first page reports the type's total, which bounds the rest
+        first = _fetch_json('POST', 'https://api.devfolio.co/api/search/hackathons', ['hits'],
+                            json={"type": list_type, "from": 0, "size": 100})
+        if not first:
+            continue
+        hits = first.get('hits') or []
+        total = _total_count(first.get('total'))
+        if len(hits) == 100:
+            hits += fetch_pages(
+                lambda offset: _fetch_json('POST', 'https://api.devfolio.co/api/search/hackathons', ['hits', 'hits'],
+                                           json={"type": list_type, "from": offset, "size": 100}),
+                range(100, min(300, total or 300), 100),  # 300 per type = 1200 total
+                window=PAGE_WINDOW,
+            )
+        
+        type_saved = 0
+        for h in hits:
             try:
-                payload = {"type": list_type, "from": offset, "size": 100}
-                r = requests.post('https://api.devfolio.co/api/search/hackathons', 
-                    json=payload, headers=headers, timeout=30)
-                
-                if r.status_code != 200:
-                    print(f'    Status {r.status_code}, stopping')
-                    break
-                    
-                hits = r.json().get('hits', {}).get('hits', [])
-                if not hits:
-                    print(f'    No more results')
-                    break
-                    
-                batch_saved = 0
-                for h in hits:
-                    try:
-                        src = h.get('_source', {})
-                        raw = {
-                            'title': src.get('name'),
-                            'url': f"https://devfolio.co/{src.get('slug')}" if src.get('slug') else None,
-                            'start_date': src.get('starts_at'),
-                            'end_date': src.get('ends_at'),
-                            'location': src.get('location') or ('Online' if src.get('is_online_event') else ''),
-                            'prize': src.get('prize_amount'),
-                            'description': src.get('tagline'),
-                            'mode': 'online' if src.get('is_online_event') else 'in-person',
-                            'tags': src.get('themes', [])
-                        }
-                        if raw['title'] and raw['url']:
-                            db.save_event(normalizer.normalize(raw, 'Devfolio'))
-                            saved += 1
-                            batch_saved += 1
-                    except: pass
-                print(f'    Offset {offset}: +{batch_saved} (total: {saved})')
-                time.sleep(0.5)
-            except Exception as e:
-                print(f'    Error at offset {offset}: {e}')
-                break
+                src = h.get('_source', {})
+                # Check the two required fields before reading the rest
+                title, slug = src.get('name'), src.get('slug')
+                if not (title and slug): continue
+                online = src.get('is_online_event')
+                raw = {
+                    'title': title,
+                    'url': f"https://devfolio.co/{slug}",
+                    'start_date': src.get('starts_at'),
+                    'end_date': src.get('ends_at'),
+                    'location': src.get('location') or ('Online' if online else ''),
+                    'prize': src.get('prize_amount'),
+                    'description': src.get('tagline'),
+                    'mode': 'online' if online else 'in-person',
+                    'tags': src.get('themes', [])
+                }
+                raws.append(raw)
+                saved += 1
+                type_saved += 1
+            except: pass
+        print(f'\n  Type {list_type}: +{type_saved} of {len(hits)} (total: {saved})')
         
         if saved >= 1000:
             break
     
+    db.save_events_bulk(normalizer.normalize_batch(raws, 'Devfolio'))  # One transaction per source
     return saved
 
 def scrape_unstop_mega():
     """Scrape 1000+ from Unstop"""
     print('\n🎪 MEGA Unstop Scrape (targeting 1000)...')
     saved = 0
+    raws = []
     
     # Unstop has different opportunity types
     types = ['hackathons', 'competitions', 'quizzes', 'ideathon']
     
     for opp_type in types:
-        print(f'\n  Type: {opp_type}')
-        for page in range(1, 15):  # 15 pages x 100 = 1500 per type
+        # The first page reports the type's total, which bounds the rest
+        first = _fetch_json('GET', f'https://unstop.com/api/public/opportunity/search-result?opportunity={opp_type}&per_page=100&page=1', ['data'])
+        if not first:
+            continue
+        items = first.get('data') or []
+        total = _total_count(first.get('total'))
+        if len(items) == 100:
+            items += fetch_pages(
+                lambda page: _fetch_json('GET', f'https://unstop.com/api/public/opportunity/search-result?opportunity={opp_type}&per_page=100&page={page}', ['data', 'data']),
+                range(2, min(15, (total + 99) // 100 + 1) if total else 15),  # 15 pages x 100 = 1500 per type
+                window=PAGE_WINDOW,
+            )
+        
+        type_saved = 0
+        for h in items:
             try:
-                url = f'https://unstop.com/api/public/opportunity/search-result?opportunity={opp_type}&per_page=100&page={page}'
-                r = requests.get(url, headers=headers, timeout=30)
-                
-                if r.status_code != 200:
-                    print(f'    Status {r.status_code}, stopping')
-                    break
-                
-                data = r.json().get('data', {})
-                items = data.get('data', [])
-                
-                if not items:
-                    print(f'    No more results')
-                    break
-                
-                batch_saved = 0
-                for h in items:
-                    try:
-                        raw = {
-                            'title': h.get('title'),
-                            'url': f"https://unstop.com/{h.get('public_url')}" if h.get('public_url') else None,
-                            'start_date': h.get('start_date'),
-                            'end_date': h.get('end_date'),
-                            'location': h.get('city') if h.get('city') else 'Online',
-                            'prize': h.get('prize_money') or h.get('prizes'),
-                            'description': h.get('seo_details', {}).get('meta_description') if isinstance(h.get('seo_details'), dict) else None,
-                            'mode': 'online' if not h.get('city') else 'in-person',
-                            'tags': [opp_type]
-                        }
-                        if raw['title'] and raw['url']:
-                            db.save_event(normalizer.normalize(raw, 'Unstop'))
-                            saved += 1
-                            batch_saved += 1
-                    except: pass
-                print(f'    Page {page}: +{batch_saved} (total: {saved})')
-                time.sleep(0.3)
-            except Exception as e:
-                print(f'    Error on page {page}: {e}')
-                break
+                # Check the two required fields before reading the rest
+                title, public_url = h.get('title'), h.get('public_url')
+                if not (title and public_url): continue
+                city = h.get('city')
+                seo = h.get('seo_details')
+                raw = {
+                    'title': title,
+                    'url': f"https://unstop.com/{public_url}",
+                    'start_date': h.get('start_date'),
+                    'end_date': h.get('end_date'),
+                    'location': city if city else 'Online',
+                    'prize': h.get('prize_money') or h.get('prizes'),
+                    'description': seo.get('meta_description') if isinstance(seo, dict) else None,
+                    'mode': 'online' if not city else 'in-person',
+                    'tags': [opp_type]
+                }
+                raws.append(raw)
+                saved += 1
+                type_saved += 1
+            except: pass
+        print(f'\n  Type {opp_type}: +{type_saved} of {len(items)} (total: {saved})')
         
         if saved >= 1000:
             break
     
+    db.save_events_bulk(normalizer.normalize_batch(raws, 'Unstop'))  # One transaction per source
     return saved
 
 def main():
@@ -133,8 +161,12 @@ def main():
     stats_before = db.get_statistics()
     print(f'\n  Starting with: {stats_before["total_events"]} hackathons')
     
-    devfolio = scrape_devfolio_mega()
-    unstop = scrape_unstop_mega()
+    # Devfolio and Unstop are different hosts, so scrape them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        devfolio_future = executor.submit(scrape_devfolio_mega)
+        unstop_future = executor.submit(scrape_unstop_mega)
+        devfolio = devfolio_future.result()
+        unstop = unstop_future.result()
     
     stats_after = db.get_statistics()
     
@@ -1,20 +1,21 @@
 """Scrape Devpost API with pagination - FIXED"""
-import requests
 import sys
 sys.path.insert(0, '.')
 from database.db_manager import DatabaseManager
 from utils.data_normalizer import DataNormalizer
+from utils.http_client import create_session, json_loads
 
 headers = {'User-Agent': 'Mozilla/5.0', 'Accept': 'application/json'}
 db = DatabaseManager('hackathons.db')
 normalizer = DataNormalizer()
+session = create_session(headers)  # Keep-alive across pages
 
 all_hackathons = []
 for page in range(1, 5):
     url = f'https://devpost.com/api/hackathons?page={page}&per_page=50'
     print(f'Fetching page {page}...')
-    r = requests.get(url, headers=headers, timeout=30)
-    data = r.json()
+    r = session.get(url, timeout=30)
+    data = json_loads(r.content)
     hackathons = data.get('hackathons', [])
     print(f'  Got {len(hackathons)} hackathons')
     if not hackathons:
@@ -29,6 +30,7 @@ if all_hackathons:
     print(f'\nSample hackathon keys: {list(h.keys())}')
 
 saved = 0
+raws = []
 for h in all_hackathons:
     try:
         # Handle dates - might be string or dict
@@ -56,12 +58,12 @@ for h in all_hackathons:
             'tags': h.get('themes') if isinstance(h.get('themes'), list) else [],
             'mode': 'online' if h.get('online_only') else 'in-person'
         }
-        event = normalizer.normalize(raw, 'Devpost')
-        db.save_event(event)
+        raws.append(raw)
         saved += 1
     except Exception as e:
         print(f'  Error for {h.get("title", "?")}: {e}')
 
+db.save_events_bulk(normalizer.normalize_batch(raws, 'Devpost'))  # One transaction for the whole run
 print(f'\nSaved {saved} to database')
 stats = db.get_statistics()
 print(f'Database now has {stats["total_events"]} total events')
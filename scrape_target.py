@@ -1,96 +1,147 @@
 """
 Deep scraper for HackerEarth, HackCulture, and Superteam
 """
+import re
 import requests
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 sys.path.insert(0, '.')
 
 from database.db_manager import DatabaseManager
 from utils.data_normalizer import DataNormalizer
+from utils.http_client import create_session, fetch_pages, json_loads
 from bs4 import BeautifulSoup
+import soupsieve as sv
 
 headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0', 'Accept': 'text/html,application/json'}
 db = DatabaseManager('hackathons.db')
 normalizer = DataNormalizer()
 
+def _is_new(seen, raw):
+    """Record raw's (url, title) - the event ID inputs - and report whether it is new.
+    Nested card selectors match the same event several times per page."""
+    key = (raw['url'], raw['title'])
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
+
+# Pages requested at once per HackerEarth challenge type
+PAGE_WINDOW = 5
+
+# One keep-alive pool per host (hackerearth, hackculture, superteam); retries
+# with backoff on 429/5xx replace the fixed sleeps between requests
+session = create_session(headers, pool_connections=3, pool_maxsize=PAGE_WINDOW)
+
+# CSS selectors compiled once instead of re-parsed by every select() call
+_CSS_LINK = sv.compile('a[href]')
+_CSS_HE_CARDS = sv.compile('.challenge-card-modern, .challenge-card, .upcoming .card, .ongoing .card, [class*="challenge"]')
+_CSS_HE_LINK_CARDS = sv.compile('a[href*="/challenges/"]')
+_CSS_HE_TITLE = sv.compile('.challenge-name, .challenge-title, h3, h4, .title')
+_CSS_HE_DATE = sv.compile('.challenge-date, .date, time, .timing')
+_CSS_HE_PRIZE = sv.compile('.prize-money, .prize, .challenge-prize')
+_CSS_HC_CARDS = sv.compile('article, .event-card, .hackathon-card, .card, [class*="event"], [class*="hack"]')
+_CSS_HC_TITLE = sv.compile('h1, h2, h3, h4, .title, .name')
+_CSS_ST_CARDS = sv.compile('[class*="card"], [class*="listing"], [class*="bounty"], [class*="opportunity"]')
+_CSS_ST_TITLE = sv.compile('h2, h3, h4, .title')
+_CSS_ST_PRIZE = sv.compile('[class*="reward"], [class*="amount"], [class*="prize"]')
+
+# JSON-LD blocks, matched on raw response bytes
+_RE_JSONLD = re.compile(rb'<script[^>]*type=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+
+def _parse_hackerearth_card(card, ctype):
+    """Raw event dict for one HackerEarth listing card, or None to skip it"""
+    # Get title
+    title_el = _CSS_HE_TITLE.select_one(card)
+    if title_el:
+        title = title_el.get_text(strip=True)
+    elif card.name == 'a':
+        title = card.get_text(strip=True)
+    else:
+        return None
+    
+    # Get URL
+    if card.name == 'a':
+        href = card.get('href', '')
+    else:
+        link = _CSS_LINK.select_one(card)
+        href = link.get('href', '') if link else ''
+    
+    if not href.startswith('http'):
+        href = 'https://www.hackerearth.com' + href
+    
+    # Get other info
+    date_el = _CSS_HE_DATE.select_one(card)
+    prize_el = _CSS_HE_PRIZE.select_one(card)
+    
+    return {
+        'title': title,
+        'url': href,
+        'start_date': date_el.get_text(strip=True) if date_el else None,
+        'prize': prize_el.get_text(strip=True) if prize_el else None,
+        'mode': 'online',
+        'tags': [ctype]
+    }
+
+def _parse_hackerearth_page(html, ctype):
+    """Parse one listing page into plain dicts, one entry per card (None for
+    unparseable cards)"""
+    soup = BeautifulSoup(html, 'lxml')
+    
+    # Try multiple selectors
+    cards = _CSS_HE_CARDS.select(soup)
+    
+    if not cards:
+        # Fallback: find any cards with links
+        cards = _CSS_HE_LINK_CARDS.select(soup)
+    
+    parsed = []
+    for card in cards:
+        try: parsed.append(_parse_hackerearth_card(card, ctype))
+        except Exception: parsed.append(None)
+    return parsed
+
+def _fetch_hackerearth_page(ctype, page):
+    """Fetch and parse one listing page; [] past the last page, None on failure."""
+    try:
+        r = session.get(f'https://www.hackerearth.com/challenges/{ctype}/?page={page}', timeout=30)
+        if r.status_code != 200:
+            return None
+    except requests.RequestException as e:
+        print(f'    Error: {e}')
+        return None
+    
+    # Parsed on the fetch_pages worker thread; lxml's parser releases the GIL
+    parsed = _parse_hackerearth_page(r.content, ctype)
+    print(f'    {ctype} page {page}: {len(parsed)} cards')
+    return parsed
+
 def scrape_hackerearth():
     """Scrape HackerEarth challenges - multiple pages and types"""
     print('\n🌍 Deep scraping HackerEarth...')
     saved = 0
+    raws = []
+    seen = set()
     
     # Different challenge types
     types = ['hackathon', 'hiring', 'competitive']
     
     for ctype in types:
         print(f'  Type: {ctype}')
-        for page in range(1, 6):  # 5 pages each
+        parsed = fetch_pages(
+            lambda page: _fetch_hackerearth_page(ctype, page),
+            range(1, 6),  # 5 pages each
+            window=PAGE_WINDOW,
+        )
+        for raw in parsed:
             try:
-                url = f'https://www.hackerearth.com/challenges/{ctype}/?page={page}'
-                r = requests.get(url, headers=headers, timeout=30)
-                
-                if r.status_code != 200:
-                    break
-                    
-                soup = BeautifulSoup(r.text, 'html.parser')
-                
-                # Try multiple selectors
-                cards = soup.select('.challenge-card-modern, .challenge-card, .upcoming .card, .ongoing .card, [class*="challenge"]')
-                
-                if not cards:
-                    # Fallback: find any cards with links
-                    cards = soup.select('a[href*="/challenges/"]')
-                    
-                print(f'    Page {page}: {len(cards)} cards')
-                
-                if not cards:
-                    break
-                    
-                for card in cards:
-                    try:
-                        # Get title
-                        title_el = card.select_one('.challenge-name, .challenge-title, h3, h4, .title')
-                        if title_el:
-                            title = title_el.get_text(strip=True)
-                        elif card.name == 'a':
-                            title = card.get_text(strip=True)
-                        else:
-                            continue
-                        
-                        # Get URL
-                        if card.name == 'a':
-                            href = card.get('href', '')
-                        else:
-                            link = card.select_one('a[href]')
-                            href = link.get('href', '') if link else ''
-                        
-                        if not href.startswith('http'):
-                            href = 'https://www.hackerearth.com' + href
-                        
-                        # Get other info
-                        date_el = card.select_one('.challenge-date, .date, time, .timing')
-                        prize_el = card.select_one('.prize-money, .prize, .challenge-prize')
-                        
-                        raw = {
-                            'title': title,
-                            'url': href,
-                            'start_date': date_el.get_text(strip=True) if date_el else None,
-                            'prize': prize_el.get_text(strip=True) if prize_el else None,
-                            'mode': 'online',
-                            'tags': [ctype]
-                        }
-                        
-                        if raw['title'] and raw['url'] and len(raw['title']) > 3:
-                            db.save_event(normalizer.normalize(raw, 'HackerEarth'))
-                            saved += 1
-                    except:
-                        pass
-                
-                time.sleep(0.5)
-            except Exception as e:
-                print(f'    Error: {e}')
-                break
+                if raw and raw['title'] and raw['url'] and len(raw['title']) > 3 and _is_new(seen, raw):
+                    raws.append(raw)
+                    saved += 1
+            except:
+                pass
     
+    db.save_events_bulk(normalizer.normalize_batch(raws, 'HackerEarth'))  # One transaction per source
     print(f'  ✓ Saved {saved} HackerEarth events')
     return saved
 
@@ -98,19 +149,21 @@ def scrape_hackculture():
     """Scrape HackCulture"""
     print('\n🎨 Deep scraping HackCulture...')
     saved = 0
+    raws = []
+    seen = set()
     
     try:
-        r = requests.get('https://hackculture.io/', headers=headers, timeout=30)
-        soup = BeautifulSoup(r.text, 'html.parser')
+        r = session.get('https://hackculture.io/', timeout=30)
+        soup = BeautifulSoup(r.content, 'lxml')
         
         # Try to find events
-        cards = soup.select('article, .event-card, .hackathon-card, .card, [class*="event"], [class*="hack"]')
+        cards = _CSS_HC_CARDS.select(soup)
         print(f'  Found {len(cards)} potential cards')
         
         for card in cards:
             try:
-                title_el = card.select_one('h1, h2, h3, h4, .title, .name')
-                link = card.select_one('a[href]') or card.find_parent('a')
+                title_el = _CSS_HC_TITLE.select_one(card)
+                link = _CSS_LINK.select_one(card) or card.find_parent('a')
                 
                 if not title_el:
                     continue
@@ -127,17 +180,16 @@ def scrape_hackculture():
                         'url': href or 'https://hackculture.io',
                         'mode': 'online'
                     }
-                    db.save_event(normalizer.normalize(raw, 'HackCulture'))
+                    if not _is_new(seen, raw): continue
+                    raws.append(raw)
                     saved += 1
             except:
                 pass
                 
-        # Also check for JSON-LD
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
+        # Also check for JSON-LD, read straight from the response bytes
+        for m in _RE_JSONLD.finditer(r.content):
             try:
-                import json
-                data = json.loads(script.string or script.get_text())
+                data = json_loads(m.group(1))
                 if isinstance(data, list):
                     items = data
                 elif isinstance(data, dict):
@@ -154,8 +206,8 @@ def scrape_hackculture():
                             'location': item.get('location', {}).get('name') if isinstance(item.get('location'), dict) else str(item.get('location', '')),
                             'mode': 'online'
                         }
-                        if raw['title'] and raw['url']:
-                            db.save_event(normalizer.normalize(raw, 'HackCulture'))
+                        if raw['title'] and raw['url'] and _is_new(seen, raw):
+                            raws.append(raw)
                             saved += 1
             except:
                 pass
@@ -163,6 +215,7 @@ def scrape_hackculture():
     except Exception as e:
         print(f'  Error: {e}')
     
+    db.save_events_bulk(normalizer.normalize_batch(raws, 'HackCulture'))  # One transaction per source
     print(f'  ✓ Saved {saved} HackCulture events')
     return saved
 
@@ -170,16 +223,21 @@ def scrape_superteam():
     """Deep scrape Superteam Earn - bounties and hackathons"""
     print('\n☀️ Deep scraping Superteam...')
     saved = 0
+    raws = []
+    seen = set()
     
     # Try the API first
     try:
-        # Listings API
-        for listing_type in ['hackathon', 'bounty', 'grant', 'project']:
-            url = f'https://earn.superteam.fun/api/listings/?type={listing_type}&take=100'
-            r = requests.get(url, headers=headers, timeout=30)
-            
+        # Listings API; the four listing types are fetched together
+        listing_types = ['hackathon', 'bounty', 'grant', 'project']
+        with ThreadPoolExecutor(max_workers=len(listing_types)) as executor:
+            responses = list(executor.map(
+                lambda t: session.get(f'https://earn.superteam.fun/api/listings/?type={t}&take=100', timeout=30),
+                listing_types,
+            ))
+        for listing_type, r in zip(listing_types, responses):
             if r.status_code == 200:
-                data = r.json()
+                data = json_loads(r.content)
                 items = data if isinstance(data, list) else data.get('data', []) if isinstance(data, dict) else []
                 print(f'  Type {listing_type}: {len(items)} items')
                 
@@ -193,30 +251,28 @@ def scrape_superteam():
                             'mode': 'online',
                             'tags': ['Solana', 'Web3', listing_type]
                         }
-                        if raw['title'] and raw['url']:
-                            db.save_event(normalizer.normalize(raw, 'Superteam'))
+                        if raw['title'] and raw['url'] and _is_new(seen, raw):
+                            raws.append(raw)
                             saved += 1
                     except:
                         pass
             
-            time.sleep(0.3)
-            
     except Exception as e:
         print(f'  API error: {e}')
     
     # Fallback: scrape HTML
     try:
-        r = requests.get('https://earn.superteam.fun/', headers=headers, timeout=30)
-        soup = BeautifulSoup(r.text, 'html.parser')
+        r = session.get('https://earn.superteam.fun/', timeout=30)
+        soup = BeautifulSoup(r.content, 'lxml')
         
-        cards = soup.select('[class*="card"], [class*="listing"], [class*="bounty"], [class*="opportunity"]')
+        cards = _CSS_ST_CARDS.select(soup)
         print(f'  HTML: {len(cards)} cards')
         
         for card in cards:
             try:
-                title = card.select_one('h2, h3, h4, .title')
-                link = card.select_one('a[href]')
-                prize = card.select_one('[class*="reward"], [class*="amount"], [class*="prize"]')
+                title = _CSS_ST_TITLE.select_one(card)
+                link = _CSS_LINK.select_one(card)
+                prize = _CSS_ST_PRIZE.select_one(card)
                 
                 if title:
                     href = link.get('href', '') if link else ''
@@ -230,14 +286,15 @@ def scrape_superteam():
                         'mode': 'online',
                         'tags': ['Solana', 'Web3']
                     }
-                    if raw['title'] and len(raw['title']) > 3:
-                        db.save_event(normalizer.normalize(raw, 'Superteam'))
+                    if raw['title'] and len(raw['title']) > 3 and _is_new(seen, raw):
+                        raws.append(raw)
                         saved += 1
             except:
                 pass
     except Exception as e:
         print(f'  HTML error: {e}')
     
+    db.save_events_bulk(normalizer.normalize_batch(raws, 'Superteam'))  # One transaction per source
     print(f'  ✓ Saved {saved} Superteam events')
     return saved
 
@@ -248,9 +305,15 @@ def main():
     
     before = db.get_statistics()['total_events']
     
-    he = scrape_hackerearth()
-    hc = scrape_hackculture()
-    st = scrape_superteam()
+    # Each scraper talks to a different host, so run them side by side
+    scrapers = [scrape_hackerearth, scrape_hackculture, scrape_superteam]
+    results = dict.fromkeys(scrapers, 0)
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        futures = {executor.submit(s): s for s in scrapers}
+        for future in as_completed(futures):
+            try: results[futures[future]] = future.result()
+            except Exception as e: print(f"  Error running {futures[future].__name__}: {e}")
+    he, hc, st = (results[s] for s in scrapers)
     
     after = db.get_statistics()
     
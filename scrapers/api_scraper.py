@@ -10,6 +10,7 @@ from typing import List, Dict, Any, Optional
 import requests
 
 from scrapers.base_scraper import BaseScraper, ScrapingError
+from utils.http_client import create_session, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,11 @@ logger = logging.getLogger(__name__)
 class BaseApiScraper(BaseScraper):
     """Base class for API-driven scrapers."""
 
+    def __init__(self, site_config: Dict, db_manager=None, normalizer=None):
+        super().__init__(site_config, db_manager, normalizer)
+        # Paginated calls to one host reuse a keep-alive connection
+        self.session = create_session(self.headers)
+
     def _scrape_with_http(self) -> List[Dict]:
         raise ScrapingError("HTTP method not supported for this API scraper")
 
@@ -26,10 +32,9 @@ class BaseApiScraper(BaseScraper):
     def _request_json(self, method: str, url: str, **kwargs) -> Any:
         self._respect_rate_limit()
         try:
-            response = requests.request(
+            response = self.session.request(
                 method,
                 url,
-                headers=self.headers,
                 timeout=30,
                 **kwargs,
             )
@@ -40,7 +45,7 @@ class BaseApiScraper(BaseScraper):
             raise ScrapingError(f"API returned {response.status_code}")
 
         try:
-            return response.json()
+            return json_loads(response.content)
         except ValueError as e:
             raise ScrapingError(f"API invalid JSON: {e}")
 
@@ -66,6 +71,11 @@ class DevpostApiScraper(BaseApiScraper):
                 break
 
             for h in items:
+                # Check the required fields before reading the rest
+                title, url = h.get("title"), h.get("url")
+                if not (title and url):
+                    continue
+
                 dates = h.get("submission_period_dates")
                 start_date = None
                 end_date = None
@@ -75,20 +85,20 @@ class DevpostApiScraper(BaseApiScraper):
                 elif isinstance(dates, str):
                     start_date = dates
 
-                raw = {
-                    "title": h.get("title"),
-                    "url": h.get("url"),
+                online = h.get("online_only")
+                themes = h.get("themes")
+                events.append({
+                    "title": title,
+                    "url": url,
                     "start_date": start_date,
                     "end_date": end_date,
-                    "location": "Online" if h.get("online_only") else h.get("displayed_location", ""),
+                    "location": "Online" if online else h.get("displayed_location", ""),
                     "prize": h.get("prize_amount"),
                     "description": h.get("tagline"),
                     "image": h.get("thumbnail_url"),
-                    "tags": h.get("themes") if isinstance(h.get("themes"), list) else [],
-                    "mode": "online" if h.get("online_only") else "in-person",
-                }
-                if raw["title"] and raw["url"]:
-                    events.append(raw)
+                    "tags": themes if isinstance(themes, list) else [],
+                    "mode": "online" if online else "in-person",
+                })
 
         logger.info("Devpost API returned %d events", len(events))
         return events
@@ -114,19 +124,23 @@ class DevfolioApiScraper(BaseApiScraper):
 
             for h in hits:
                 src = h.get("_source", {})
-                raw = {
-                    "title": src.get("name"),
-                    "url": f"https://devfolio.co/{src.get('slug')}" if src.get("slug") else None,
+                # Check the required fields before reading the rest
+                title, slug = src.get("name"), src.get("slug")
+                if not (title and slug):
+                    continue
+
+                online = src.get("is_online_event")
+                events.append({
+                    "title": title,
+                    "url": f"https://devfolio.co/{slug}",
                     "start_date": src.get("starts_at"),
                     "end_date": src.get("ends_at"),
-                    "location": src.get("location") or ("Online" if src.get("is_online_event") else ""),
+                    "location": src.get("location") or ("Online" if online else ""),
                     "prize": src.get("prize_amount"),
                     "description": src.get("tagline"),
-                    "mode": "online" if src.get("is_online_event") else "in-person",
+                    "mode": "online" if online else "in-person",
                     "tags": src.get("themes", []),
-                }
-                if raw["title"] and raw["url"]:
-                    events.append(raw)
+                })
 
         logger.info("Devfolio API returned %d events", len(events))
         return events
@@ -154,22 +168,24 @@ class UnstopApiScraper(BaseApiScraper):
                 break
 
             for h in items:
-                has_city = bool(h.get("city"))
-                raw = {
-                    "title": h.get("title"),
-                    "url": f"https://unstop.com/{h.get('public_url')}" if h.get("public_url") else None,
+                # Check the required fields before reading the rest
+                title, public_url = h.get("title"), h.get("public_url")
+                if not (title and public_url):
+                    continue
+
+                city = h.get("city")
+                seo = h.get("seo_details")
+                events.append({
+                    "title": title,
+                    "url": f"https://unstop.com/{public_url}",
                     "start_date": h.get("start_date"),
                     "end_date": h.get("end_date"),
-                    "location": h.get("city") or "Online",
+                    "location": city or "Online",
                     "prize": h.get("prize_money") or h.get("prizes"),
-                    "description": h.get("seo_details", {}).get("meta_description")
-                    if isinstance(h.get("seo_details"), dict)
-                    else None,
-                    "mode": "in-person" if has_city else "online",
+                    "description": seo.get("meta_description") if isinstance(seo, dict) else None,
+                    "mode": "in-person" if city else "online",
                     "tags": [opportunity],
-                }
-                if raw["title"] and raw["url"]:
-                    events.append(raw)
+                })
 
         logger.info("Unstop API returned %d events", len(events))
         return events
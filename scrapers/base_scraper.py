@@ -12,13 +12,15 @@ The scraping waterfall:
 All site-specific scrapers inherit from this class.
 """
 
-import json
 import time
 import logging
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urljoin
+
+from utils.http_client import json_loads
 
 # Set up logging
 logging.basicConfig(
@@ -292,7 +294,6 @@ class BaseScraper(ABC):
             return ""
         if url.startswith('http'):
             return url
-        from urllib.parse import urljoin
         return urljoin(self.url, url)
 
 
@@ -317,8 +318,7 @@ class ScraperFactory:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config not found: {self.config_path}")
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_loads(self.config_path.read_bytes())
     
     def get_scraper(
         self,
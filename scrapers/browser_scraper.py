@@ -426,7 +426,7 @@ class BrowserScraper(BaseScraper):
         if not BeautifulSoup:
             return []
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         events = self._parse_jsonld_events(soup, base_url)
         if events:
             return events
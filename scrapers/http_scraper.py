@@ -21,6 +21,7 @@ import logging
 import re
 
 from scrapers.base_scraper import BaseScraper, ScrapingError
+from utils.http_client import create_session, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +38,8 @@ class HttpScraper(BaseScraper):
     
     def __init__(self, site_config: Dict, db_manager=None, normalizer=None):
         super().__init__(site_config, db_manager, normalizer)
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # Keep-alive pool with backoff retries on connection errors, 429 and 5xx
+        self.session = create_session(self.headers)
     
     def _scrape_with_http(self) -> List[Dict]:
         """
@@ -94,7 +95,7 @@ class HttpScraper(BaseScraper):
         except requests.RequestException as e:
             raise ScrapingError(f"HTTP request failed: {e}")
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         return self._parse_events(soup, response.url)
     
     def _scrape_numbered_pages(self, max_pages: int = 10) -> List[Dict]:
@@ -151,7 +152,7 @@ class HttpScraper(BaseScraper):
                 logger.warning(f"Request failed for {current_url}: {e}")
                 break
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             events = self._parse_events(soup, response.url)
             
             if not events:
@@ -186,7 +187,7 @@ class HttpScraper(BaseScraper):
             try:
                 response = self.session.get(api_url, timeout=15)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = json_loads(response.content)
                     return self._parse_api_response(data)
             except Exception:
                 pass
@@ -208,7 +209,7 @@ class HttpScraper(BaseScraper):
                 if response.status_code == 200:
                     content_type = response.headers.get('content-type', '')
                     if 'json' in content_type:
-                        data = response.json()
+                        data = json_loads(response.content)
                         if isinstance(data, (list, dict)):
                             events = self._parse_api_response(data)
                             if events:
@@ -11,6 +11,7 @@ from typing import List, Dict, Any
 import requests
 
 from scrapers.base_scraper import BaseScraper, ScrapingError
+from utils.http_client import create_session, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,11 @@ logger = logging.getLogger(__name__)
 class KaggleScraper(BaseScraper):
     """Scraper for Kaggle competitions using API endpoints."""
 
+    def __init__(self, site_config: Dict, db_manager=None, normalizer=None):
+        super().__init__(site_config, db_manager, normalizer)
+        # The authenticated and public endpoints share a host and connection
+        self.session = create_session(self.headers)
+
     def _scrape_with_http(self) -> List[Dict]:
         raise ScrapingError("Kaggle scraping requires the API method")
 
@@ -40,10 +46,9 @@ class KaggleScraper(BaseScraper):
         self._respect_rate_limit()
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 auth=(username, key),
-                headers=self.headers,
                 timeout=30,
             )
         except requests.RequestException as e:
@@ -55,7 +60,7 @@ class KaggleScraper(BaseScraper):
             raise ScrapingError(f"Kaggle API returned {response.status_code}")
 
         try:
-            data = response.json()
+            data = json_loads(response.content)
         except ValueError as e:
             raise ScrapingError(f"Kaggle API invalid JSON: {e}")
 
@@ -69,7 +74,7 @@ class KaggleScraper(BaseScraper):
         self._respect_rate_limit()
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
         except requests.RequestException as e:
             raise ScrapingError(f"Kaggle public request failed: {e}")
 
@@ -77,7 +82,7 @@ class KaggleScraper(BaseScraper):
             raise ScrapingError(f"Kaggle public endpoint returned {response.status_code}")
 
         try:
-            data = response.json()
+            data = json_loads(response.content)
         except ValueError as e:
             raise ScrapingError(f"Kaggle public invalid JSON: {e}")
 
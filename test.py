@@ -94,7 +94,7 @@ class WebsiteAnalyzer:
                 return analysis
             
             html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             
             # 1. Detect framework/type
             analysis['framework'] = self._detect_framework(html, soup)
@@ -0,0 +1,13 @@
+"""
+Shared test setup.
+
+The scraper scripts open ./hackathons.db at import time, so the tests run
+from a scratch directory with the repository root on sys.path.
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(tempfile.mkdtemp(prefix='hackfind-tests-'))
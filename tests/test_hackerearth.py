@@ -0,0 +1,37 @@
+"""Tests for the HackerEarth link -> card lookup in scrape_all"""
+from bs4 import BeautifulSoup
+
+from scrape_all import _hackerearth_card_map
+
+
+def _card_for(html, href):
+    soup = BeautifulSoup(html, 'lxml')
+    link = soup.find('a', href=href)
+    return _hackerearth_card_map(soup).get(id(link))
+
+
+def test_modern_card_wins_over_nested_plain_card():
+    html = '''
+    <div class="challenge-card-modern" id="outer">
+      <div class="challenge-list-title">Big Hack</div>
+      <div class="challenge-card" id="inner">
+        <a href="/challenges/hackathon/big-hack/">Go</a>
+      </div>
+    </div>
+    '''
+    assert _card_for(html, '/challenges/hackathon/big-hack/')['id'] == 'outer'
+
+
+def test_plain_card_used_without_modern_ancestor():
+    html = '''
+    <div class="challenge-card" id="outer">
+      <div class="challenge-card" id="inner">
+        <a href="/challenges/hackathon/x/">Go</a>
+      </div>
+    </div>
+    '''
+    assert _card_for(html, '/challenges/hackathon/x/')['id'] == 'inner'
+
+
+def test_link_outside_cards_has_no_card():
+    assert _card_for('<a href="/challenges/hackathon/y/">Y</a>', '/challenges/hackathon/y/') is None
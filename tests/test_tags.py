@@ -0,0 +1,30 @@
+"""Tests for scrape_all.extract_tags_from_text"""
+from scrape_all import extract_tags_from_text
+
+
+def test_plural_keywords_are_tagged():
+    assert 'app' in extract_tags_from_text('Build AI apps for healthcare and education')
+    assert 'student' in extract_tags_from_text('Open to all students, online and remote')
+    assert 'beginner' in extract_tags_from_text('Beginners welcome')
+
+
+def test_keywords_match_whole_words_only():
+    # Substrings of longer words ("art", "learning", "happy") are not keywords
+    tags = extract_tags_from_text('An art and learning jam for happy people')
+    assert 'AR' not in tags
+    assert 'app' not in tags
+
+
+def test_bigram_keyword():
+    assert extract_tags_from_text('Applied Machine Learning') == ['machine learning']
+
+
+def test_empty_text():
+    assert extract_tags_from_text('') == []
+    assert extract_tags_from_text(None) == []
+
+
+def test_tags_follow_keyword_table_order():
+    text = 'Remote students build mobile games with AI'
+    assert extract_tags_from_text(text) == ['AI', 'mobile', 'student', 'remote']
+    assert extract_tags_from_text(text, max_tags=2) == ['AI', 'mobile']
@@ -9,11 +9,15 @@ search, filter, and display data regardless of where it came from.
 
 import re
 import hashlib
+import logging
+from functools import lru_cache
 from datetime import datetime, date
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class EventMode(Enum):
     """Event participation modes."""
@@ -99,23 +103,41 @@ class DataNormalizer:
     - Mode detection (in-person/online/hybrid)
     - Tag extraction
     - Unique ID generation
+    
+    Results are memoized on a hash of the raw payload, so re-scraping an
+    unchanged event is a dictionary lookup instead of a full normalization.
     """
     
+    # Patterns shared by every instance, compiled once at import
+    _WS_RE = re.compile(r'\s+')
+    _UTM_FIRST_RE = re.compile(r'\?utm_[^&]+&?')
+    _UTM_REST_RE = re.compile(r'&utm_[^&]+')
+    _DIGITS_RE = re.compile(r'\d+')
+    _DATE_RANGE_RE = re.compile(r'(\w+\s+\d+)\s*[-–]\s*(\w+\s+\d+),?\s*(\d{4})?')
+    _NUMBER_RE = re.compile(r'[\d,]+\.?\d*')
+    _THOUSANDS_RE = re.compile(r'\dk\b')
+    _MILLIONS_RE = re.compile(r'\dm\b')
+    _NON_NUMERIC_RE = re.compile(r'[\d,.$€£¥₹\s]+')
+    _TAG_SPLIT_RE = re.compile(r'[,;|]')
+    
+    # Date formats we encounter, keyed by the string shape they can match, so
+    # a string is only tried against strptime formats that fit it
+    _DATE_SHAPES = (
+        (re.compile(r'\d{4}-\d{1,2}-\d{1,2}'),                # 2026-02-15
+         ("%Y-%m-%d",)),
+        (re.compile(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}'),         # February 15, 2026 / Feb 15, 2026
+         ("%B %d, %Y", "%b %d, %Y")),
+        (re.compile(r'\d{1,2}\s+[A-Za-z]+\s+\d{4}'),          # 15 February 2026 / 15 Feb 2026
+         ("%d %B %Y", "%d %b %Y")),
+        (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),                # 02/15/2026 / 15/02/2026
+         ("%m/%d/%Y", "%d/%m/%Y")),
+        (re.compile(r'\d{4}/\d{1,2}/\d{1,2}'),                # 2026/02/15
+         ("%Y/%m/%d",)),
+        (re.compile(r'[A-Za-z]+\s+\d{1,2}'),                   # February 15 / Feb 15 (assume current year)
+         ("%B %d", "%b %d")),
+    )
+    
     def __init__(self):
-        # Common date formats we encounter
-        self.date_formats = [
-            "%Y-%m-%d",                    # 2026-02-15
-            "%B %d, %Y",                   # February 15, 2026
-            "%b %d, %Y",                   # Feb 15, 2026
-            "%d %B %Y",                    # 15 February 2026
-            "%d %b %Y",                    # 15 Feb 2026
-            "%m/%d/%Y",                    # 02/15/2026
-            "%d/%m/%Y",                    # 15/02/2026
-            "%Y/%m/%d",                    # 2026/02/15
-            "%B %d",                       # February 15 (assume current year)
-            "%b %d",                       # Feb 15
-        ]
-        
         # Keywords that indicate online events
         self.online_keywords = [
             "online", "virtual", "remote", "worldwide", "global",
@@ -145,6 +167,11 @@ class DataNormalizer:
             "virtual reality": "AR/VR",
             "open source": "Open Source",
         }
+        
+        # The string-parsing steps are pure, so cache them per instance;
+        # listings repeat the same date and prize strings across events
+        self._parse_date_text = lru_cache(maxsize=4096)(self._parse_date_text)
+        self._normalize_prize_text = lru_cache(maxsize=4096)(self._normalize_prize_text)
     
     def normalize(self, raw_data: Dict, source: str) -> HackathonEvent:
         """
@@ -158,6 +185,53 @@ class DataNormalizer:
         Returns:
             HackathonEvent: Normalized event object
         """
+        return self._finalize(self._normalize(raw_data, source),
+                              datetime.utcnow().isoformat(), datetime.now().date())
+    
+    def normalize_batch(self, raw_events: List[Dict], source: str) -> List[HackathonEvent]:
+        """
+        Normalize many payloads from one source, e.g. a scraper's whole run.
+        
+        The events share one scraped_at timestamp and one "today" for status,
+        so status is worked out once per distinct (start, end) date pair, and
+        a payload that fails to normalize is logged and skipped instead of
+        aborting the batch.
+        
+        Args:
+            raw_events: Raw dictionaries from a scraper
+            source: Source platform name (e.g., "Devpost")
+            
+        Returns:
+            List[HackathonEvent]: Normalized events, in input order
+        """
+        scraped_at = datetime.utcnow().isoformat()
+        today = datetime.now().date()
+        statuses: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        events = []
+        for raw_data in raw_events:
+            try:
+                event = self._normalize(raw_data, source)
+                dates = (event.start_date, event.end_date)
+                status = statuses.get(dates)
+                if status is None:
+                    status = statuses[dates] = self._determine_status(*dates, today)
+                events.append(self._finalize(event, scraped_at, today, status))
+            except Exception as e:
+                title = raw_data.get('title', '?') if isinstance(raw_data, dict) else '?'
+                logger.warning("Skipping %s event %r: %s", source, title, e)
+                continue
+        return events
+    
+    def _finalize(self, event: HackathonEvent, scraped_at: str, today: date,
+                  status: Optional[str] = None) -> HackathonEvent:
+        """Stamp a freshly normalized event with its scrape time and status."""
+        event.status = status or self._determine_status(event.start_date, event.end_date, today)
+        event.scraped_at = scraped_at
+        return event
+    
+    def _normalize(self, raw_data: Dict, source: str) -> HackathonEvent:
+        """Normalize a single raw payload; status and scraped_at are left for
+        _finalize, which knows the run's timestamp and "today"."""
         # Generate unique ID
         unique_id = self._generate_id(source, raw_data)
         
@@ -180,8 +254,13 @@ class DataNormalizer:
         # Parse tags
         tags = self._normalize_tags(raw_data.get('tags', []))
         
-        # Determine status
-        status = self._determine_status(start_date, end_date)
+        # Team size: explicit min/max win, else parse the combined field once
+        team_min = self._parse_int(raw_data.get('team_size_min'))
+        team_max = self._parse_int(raw_data.get('team_size_max'))
+        if not (team_min and team_max):
+            parsed_min, parsed_max = self._parse_team_size(raw_data.get('team_size') or raw_data.get('team_size_max'))
+            team_min = team_min or parsed_min
+            team_max = team_max or parsed_max
         
         return HackathonEvent(
             id=unique_id,
@@ -202,10 +281,8 @@ class DataNormalizer:
             logo_url=raw_data.get('logo_url') or raw_data.get('logo'),
             organizer=raw_data.get('organizer'),
             participants_count=self._parse_int(raw_data.get('participants')),
-            team_size_min=self._parse_int(raw_data.get('team_size_min')) or self._parse_team_size(raw_data.get('team_size') or raw_data.get('team_size_max'))[0],
-            team_size_max=self._parse_int(raw_data.get('team_size_max')) or self._parse_team_size(raw_data.get('team_size') or raw_data.get('team_size_max'))[1],
-            status=status,
-            scraped_at=datetime.utcnow().isoformat(),
+            team_size_min=team_min,
+            team_size_max=team_max,
             last_updated=raw_data.get('last_updated'),
         )
 
@@ -224,7 +301,7 @@ class DataNormalizer:
             
         s = str(size_val).lower()
         # "1-4", "1 - 4 members", "2 to 5"
-        nums = re.findall(r'\d+', s)
+        nums = self._DIGITS_RE.findall(s)
         
         if len(nums) >= 2:
             return int(nums[0]), int(nums[1])
@@ -251,7 +328,7 @@ class DataNormalizer:
         if not isinstance(text, str):
             text = str(text)
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = self._WS_RE.sub(' ', text)
         return text.strip()
     
     def _normalize_url(self, url: Any) -> str:
@@ -262,8 +339,8 @@ class DataNormalizer:
             url = str(url)
         url = url.strip()
         # Remove any tracking parameters (optional)
-        url = re.sub(r'\?utm_[^&]+&?', '?', url)
-        url = re.sub(r'&utm_[^&]+', '', url)
+        url = self._UTM_FIRST_RE.sub('?', url)
+        url = self._UTM_REST_RE.sub('', url)
         url = url.rstrip('?&')
         return url
     
@@ -281,31 +358,35 @@ class DataNormalizer:
         if not isinstance(date_str, str):
             return None
         
-        date_str = date_str.strip()
-        
-        # Try each format
-        for fmt in self.date_formats:
+        # Year-less formats resolve against today, so it is part of the cache key
+        return self._parse_date_text(date_str.strip(), date.today())
+    
+    def _parse_date_text(self, date_str: str, today: date) -> Optional[str]:
+        """Parse a stripped date string relative to today (cached in __init__)."""
+        # Try only the formats whose shape fits the string
+        formats = ()
+        for shape, shape_formats in self._DATE_SHAPES:
+            if shape.fullmatch(date_str):
+                formats = shape_formats
+                break
+        for fmt in formats:
             try:
                 parsed = datetime.strptime(date_str, fmt)
                 # If year wasn't in format, assume current or next year
                 if "%Y" not in fmt and "%y" not in fmt:
-                    today = datetime.now()
                     parsed = parsed.replace(year=today.year)
-                    # If date is in the past, assume next year
-                    if parsed < today:
+                    # If date is in the past (or today), assume next year
+                    if parsed.date() <= today:
                         parsed = parsed.replace(year=today.year + 1)
                 return parsed.strftime("%Y-%m-%d")
             except ValueError:
                 continue
         
         # Try to extract date from strings like "Feb 15 - Feb 17, 2026"
-        range_match = re.search(
-            r'(\w+\s+\d+)\s*[-–]\s*(\w+\s+\d+),?\s*(\d{4})?',
-            date_str
-        )
+        range_match = self._DATE_RANGE_RE.search(date_str)
         if range_match:
             month_day = range_match.group(1)
-            year = range_match.group(3) or str(datetime.now().year)
+            year = range_match.group(3) or str(today.year)
             try:
                 parsed = datetime.strptime(f"{month_day}, {year}", "%b %d, %Y")
                 return parsed.strftime("%Y-%m-%d")
@@ -324,7 +405,7 @@ class DataNormalizer:
         location = location.strip()
         
         # Standardize common variations
-        location = re.sub(r'\s+', ' ', location)
+        location = self._WS_RE.sub(' ', location)
         location = location.replace('USA', 'United States')
         location = location.replace('UK', 'United Kingdom')
         
@@ -382,7 +463,10 @@ class DataNormalizer:
         if not isinstance(prize, str):
             prize = str(prize)
         
-        prize = prize.strip()
+        return self._normalize_prize_text(prize.strip())
+    
+    def _normalize_prize_text(self, prize: str) -> tuple[Optional[str], float]:
+        """Normalize a stripped prize string (cached in __init__)."""
         original_prize = prize  # Keep original for non-monetary prizes
         
         # Detect currency symbol from the original prize string
@@ -402,7 +486,7 @@ class DataNormalizer:
         
         # Extract numeric value
         # Handle formats like "$10,000", "$10K", "10000 USD", "₹50,000"
-        numeric_match = re.search(r'[\d,]+\.?\d*', prize.replace(',', ''))
+        numeric_match = self._NUMBER_RE.search(prize.replace(',', ''))
         if not numeric_match:
             # No number found - return original text (e.g., "Shower", "Swag")
             return original_prize, 0.0
@@ -414,16 +498,17 @@ class DataNormalizer:
             return original_prize, 0.0
         
         # Handle K/M suffixes
-        if re.search(r'\dk\b', prize.lower()):
+        lowered = prize.lower()
+        if self._THOUSANDS_RE.search(lowered):
             value *= 1000
-        elif re.search(r'\dm\b', prize.lower()):
+        elif self._MILLIONS_RE.search(lowered):
             value *= 1000000
         
         # If value is 0 and original text has non-numeric content, keep original
         # (e.g., "Shower" instead of "$0")
         if value == 0:
             # Check if original has meaningful non-numeric text
-            non_numeric_text = re.sub(r'[\d,.$€£¥₹\s]+', '', original_prize).strip()
+            non_numeric_text = self._NON_NUMERIC_RE.sub('', original_prize).strip()
             if non_numeric_text:
                 # Has meaningful text like "Shower", "Swag", etc.
                 return original_prize, 0.0
@@ -441,7 +526,7 @@ class DataNormalizer:
         
         if isinstance(tags, str):
             # Split by common delimiters
-            tags = re.split(r'[,;|]', tags)
+            tags = self._TAG_SPLIT_RE.split(tags)
         
         normalized = []
         seen = set()
@@ -466,21 +551,22 @@ class DataNormalizer:
         
         return normalized[:10]  # Limit to 10 tags
     
-    def _determine_status(self, start_date: Optional[str], end_date: Optional[str]) -> str:
+    def _determine_status(self, start_date: Optional[str], end_date: Optional[str],
+                          today: Optional[date] = None) -> str:
         """Determine event status based on dates."""
         if not start_date:
             return EventStatus.UNKNOWN.value
         
-        today = datetime.now().date()
+        today = today or datetime.now().date()
         
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
+            start = date.fromisoformat(start_date)  # Normalized dates are ISO
         except ValueError:
             return EventStatus.UNKNOWN.value
         
         if end_date:
             try:
-                end = datetime.strptime(end_date, "%Y-%m-%d").date()
+                end = date.fromisoformat(end_date)
             except ValueError:
                 end = start
         else:
@@ -523,7 +609,7 @@ def normalize_events(raw_events: List[Dict], source: str) -> List[HackathonEvent
         events = normalize_events(scraped_data, 'Devpost')
     """
     normalizer = DataNormalizer()
-    return [normalizer.normalize(event, source) for event in raw_events]
+    return normalizer.normalize_batch(raw_events, source)
 
 
 if __name__ == "__main__":